@@ -17,13 +17,24 @@ from rich import print as rprint
 from godaddy_cli.__version__ import __version__
 from godaddy_cli.core.config import ConfigManager
 from godaddy_cli.core.auth import AuthManager
+from godaddy_cli.utils.lazy_group import LazyGroup
 # Commands will be imported individually below
 
 console = Console()
 
 CONTEXT_SETTINGS = dict(help_option_names=['-h', '--help'])
 
-@click.group(context_settings=CONTEXT_SETTINGS, invoke_without_command=True)
+# Imported only when one of these commands is looked up; the short help is
+# what `godaddy --help` lists, so it must match the command's docstring
+LAZY_SUBCOMMANDS = {
+    'domains': ('godaddy_cli.commands.domain', 'domains_group', 'Domain management commands'),
+    'export': ('godaddy_cli.commands.export', 'export_group', 'DNS export commands'),
+    'import': ('godaddy_cli.commands.import_cmd', 'import_group', 'DNS import commands'),
+    'monitor': ('godaddy_cli.commands.monitor', 'monitor_group', 'DNS monitoring commands'),
+}
+
+@click.group(context_settings=CONTEXT_SETTINGS, invoke_without_command=True,
+             cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS)
 @click.version_option(version=__version__, prog_name='GoDaddy DNS CLI')
 @click.option('--profile', '-p', default='default', help='Configuration profile to use')
 @click.option('--debug', is_flag=True, help='Enable debug mode')
@@ -133,12 +144,6 @@ try:
 except ImportError:
     pass
 
-try:
-    from godaddy_cli.commands.domain import domains_group
-    cli.add_command(domains_group)
-except ImportError:
-    pass
-
 try:
     from godaddy_cli.commands.config import config_group
     cli.add_command(config_group)
@@ -157,24 +162,6 @@ try:
 except ImportError:
     pass
 
-try:
-    from godaddy_cli.commands.export import export_group
-    cli.add_command(export_group)
-except ImportError:
-    pass
-
-try:
-    from godaddy_cli.commands.import_cmd import import_group
-    cli.add_command(import_group)
-except ImportError:
-    pass
-
-try:
-    from godaddy_cli.commands.monitor import monitor_group
-    cli.add_command(monitor_group)
-except ImportError:
-    pass
-
 try:
     from godaddy_cli.commands.bulk import bulk_group
     cli.add_command(bulk_group)
@@ -8,6 +8,7 @@ import json
 import csv
 import yaml
 import asyncio
+from dataclasses import asdict
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor
@@ -544,7 +545,7 @@ async def _process_bulk_deletions(auth_manager: AuthManager, profile: str,
                         if backup_dir and records:
                             backup_file = Path(backup_dir) / f"{domain}_backup.json"
                             with open(backup_file, 'w') as f:
-                                json.dump([r.__dict__ for r in records], f, indent=2)
+                                json.dump([asdict(r) for r in records], f, indent=2)
 
                         # Delete records
                         deletions = 0
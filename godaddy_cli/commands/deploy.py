@@ -5,6 +5,8 @@ DNS deployment commands for CI/CD integration
 import click
 import os
 import json
+import hashlib
+from pathlib import Path
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
@@ -27,8 +29,10 @@ def deploy_group(ctx):
 @click.option('--output', '-o', help='Save deployment plan to file')
 @click.option('--format', 'output_format', type=click.Choice(['json', 'yaml', 'text']),
               default='text', help='Plan output format')
+@click.option('--no-cache', is_flag=True, help='Always regenerate the plan, ignoring cached results')
 @click.pass_context
-def deployment_plan(ctx, domain: str, config_file: str, output: Optional[str], output_format: str):
+def deployment_plan(ctx, domain: str, config_file: str, output: Optional[str], output_format: str,
+                    no_cache: bool):
     """Generate deployment plan for DNS changes"""
     try:
         validate_domain(domain)
@@ -49,24 +53,33 @@ def deployment_plan(ctx, domain: str, config_file: str, output: Optional[str], o
 
         # Get current DNS records
         current_records = client.list_dns_records(domain)
-        current_state = {
-            f"{r.name}.{r.type}": r
-            for r in current_records
-        }
-
-        # Parse desired records
-        desired_records = []
-        for record_data in desired_config.get('records', []):
-            record = DNSRecord.from_api_dict(record_data)
-            desired_records.append(record)
 
-        desired_state = {
-            f"{r.name}.{r.type}": r
-            for r in desired_records
-        }
+        # Reuse the cached plan when neither side changed since the last run
+        cache_file = _plan_cache_path(ctx.obj['config'], domain)
+        desired_hash = _content_hash(desired_config)
+        current_hash = _content_hash([r.to_api_dict() for r in current_records])
+        plan = None if no_cache else _load_cached_plan(cache_file, desired_hash, current_hash)
+
+        if plan is None:
+            current_state = {
+                f"{r.name}.{r.type}": r
+                for r in current_records
+            }
+
+            # Parse desired records
+            desired_records = []
+            for record_data in desired_config.get('records', []):
+                record = DNSRecord.from_api_dict(record_data)
+                desired_records.append(record)
+
+            desired_state = {
+                f"{r.name}.{r.type}": r
+                for r in desired_records
+            }
 
-        # Generate deployment plan
-        plan = _generate_deployment_plan(current_state, desired_state)
+            # Generate deployment plan
+            plan = _generate_deployment_plan(current_state, desired_state)
+            _save_cached_plan(cache_file, desired_hash, current_hash, plan)
 
         # Format and output plan
         if output_format == 'json':
@@ -207,16 +220,18 @@ def apply_deployment(ctx, domain: str, config_file: str, plan_file: Optional[str
 
         all_changes = []
 
-        # Process deletions first
-        for change in plan['delete']:
+        # Process deletions first, all in flight at once
+        if plan['delete']:
+            targets = [(change['type'], change['name']) for change in plan['delete']]
             try:
-                success = client.delete_dns_record(domain, change['type'], change['name'])
-                if success:
-                    click.echo(f"✓ Deleted {change['name']} {change['type']}")
-                else:
-                    click.echo(f"✗ Failed to delete {change['name']} {change['type']}")
+                outcomes = client.delete_dns_records(domain, targets)
+                for change, success in zip(plan['delete'], outcomes):
+                    if success:
+                        click.echo(f"✓ Deleted {change['name']} {change['type']}")
+                    else:
+                        click.echo(f"✗ Failed to delete {change['name']} {change['type']}")
             except Exception as e:
-                click.echo(f"✗ Error deleting {change['name']} {change['type']}: {str(e)}")
+                click.echo(f"✗ Error deleting records: {str(e)}")
 
         # Process creates and updates in batches
         update_records = []
@@ -231,8 +246,8 @@ def apply_deployment(ctx, domain: str, config_file: str, plan_file: Optional[str
 
         if update_records:
             with click.progressbar(length=len(update_records), label='Applying changes') as bar:
-                results = client.bulk_update_records(domain, update_records, batch_size)
-                bar.update(len(update_records))
+                results = client.bulk_update_records(domain, update_records, batch_size,
+                                                     on_progress=bar.update)
 
             click.echo(format_bulk_operation_summary(results))
 
@@ -304,18 +319,21 @@ def rollback_deployment(ctx, domain: str, backup_file: str, auto_approve: bool):
         click.echo("Clearing existing DNS records...")
         current_records = client.list_dns_records(domain)
 
-        for record in current_records:
-            try:
-                client.delete_dns_record(domain, record.type, record.name)
-            except Exception as e:
-                click.echo(f"Warning: Failed to delete {record.name} {record.type}: {str(e)}")
+        targets = list(dict.fromkeys((record.type, record.name) for record in current_records))
+        try:
+            outcomes = client.delete_dns_records(domain, targets)
+            for (record_type, name), success in zip(targets, outcomes):
+                if not success:
+                    click.echo(f"Warning: Failed to delete {name} {record_type}")
+        except Exception as e:
+            click.echo(f"Warning: Failed to clear existing records: {str(e)}")
 
         # Restore from backup
         click.echo("Restoring records from backup...")
 
         with click.progressbar(length=len(records_to_restore), label='Restoring records') as bar:
-            results = client.bulk_update_records(domain, records_to_restore, batch_size=10)
-            bar.update(len(records_to_restore))
+            results = client.bulk_update_records(domain, records_to_restore, batch_size=10,
+                                                 on_progress=bar.update)
 
         click.echo(format_bulk_operation_summary(results))
 
@@ -391,6 +409,47 @@ def _generate_deployment_plan(current_state: Dict[str, DNSRecord],
     return plan
 
 
+def _content_hash(data: Any) -> str:
+    """Return a stable content hash for JSON-serializable data"""
+    payload = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _plan_cache_path(config, domain: str) -> Path:
+    """Get the cache file used for a domain's deployment plan"""
+    return config.config_dir / 'cache' / 'plans' / f'{domain}.json'
+
+
+def _load_cached_plan(cache_file: Path, desired_hash: str,
+                      current_hash: str) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """Load a cached plan if it was generated from the same desired and current state"""
+    try:
+        with open(cache_file, 'r') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if cached.get('desired_hash') != desired_hash or cached.get('current_hash') != current_hash:
+        return None
+
+    return cached.get('plan')
+
+
+def _save_cached_plan(cache_file: Path, desired_hash: str, current_hash: str,
+                      plan: Dict[str, List[Dict[str, Any]]]):
+    """Persist a generated plan; caching is best-effort and never fails the command"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump({
+                'desired_hash': desired_hash,
+                'current_hash': current_hash,
+                'plan': plan
+            }, f, default=str)
+    except OSError:
+        pass
+
+
 def _records_differ(record1: DNSRecord, record2: DNSRecord) -> bool:
     """Check if two DNS records differ in meaningful ways"""
     return (
@@ -5,15 +5,20 @@ Core DNS record operations with enterprise features
 
 import click
 import asyncio
+import ipaddress
 import json
+import time
+from collections import Counter
+from dataclasses import asdict
 from typing import Optional, List
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Confirm
-from tabulate import tabulate
 
-from godaddy_cli.core.api_client import GoDaddyAPIClient, SyncGoDaddyAPIClient, DNSRecord, RecordType
+from godaddy_cli.core.api_client import (
+    GoDaddyAPIClient, SyncGoDaddyAPIClient, DNSRecord, RecordType, run_sync
+)
 from godaddy_cli.core.simple_api_client import APIClient
 from godaddy_cli.core.auth import AuthManager
 from godaddy_cli.utils.validators import validate_domain, validate_ip, validate_ttl
@@ -23,6 +28,9 @@ from godaddy_cli.core.exceptions import GoDaddyDNSError
 
 console = Console()
 
+# Record type names accepted by the add/delete/update arguments
+_RECORD_TYPE_VALUES = tuple(t.value for t in RecordType)
+
 @click.group()
 @click.pass_context
 def dns(ctx):
@@ -34,7 +42,7 @@ def dns(ctx):
 @click.option('--type', '-t', 'record_type', help='Filter by record type (A, AAAA, CNAME, etc.)')
 @click.option('--name', '-n', help='Filter by record name')
 @click.option('--format', '-f', 'output_format',
-              type=click.Choice(['table', 'json', 'yaml', 'csv']),
+              type=click.Choice(['table', 'json', 'ndjson', 'yaml', 'csv']),
               default='table', help='Output format')
 @click.option('--export', '-e', type=click.Path(), help='Export to file')
 @click.pass_context
@@ -46,12 +54,15 @@ def list(ctx, domain, record_type, name, output_format, export):
         godaddy dns list example.com --type A
         godaddy dns list example.com --name www
         godaddy dns list example.com --format json
+        godaddy dns list example.com --format ndjson --export records.ndjson
     """
 
     if not validate_domain(domain):
         console.print(f"[red]Invalid domain: {domain}[/red]")
         return
 
+    debug = ctx.obj.get('debug', False)
+
     try:
         # Get API credentials
         auth_manager = ctx.obj['auth']
@@ -80,61 +91,46 @@ def list(ctx, domain, record_type, name, output_format, export):
                     console.print(f"[dim]Try: godaddy dns add {domain}[/dim]")
                 return
 
-        # Format output
-        if ctx.obj['output_json'] or output_format == 'json':
-            output = format_json_output(records)
-        elif output_format == 'yaml':
-            import yaml
-            output = yaml.dump([r.__dict__ for r in records], default_flow_style=False)
-        elif output_format == 'csv':
-            import csv
-            import io
-            buffer = io.StringIO()
-            writer = csv.writer(buffer)
-            writer.writerow(['Name', 'Type', 'Data', 'TTL', 'Priority'])
-            for record in records:
-                writer.writerow([record.name, record.type, record.data,
-                               record.ttl, record.priority or ''])
-            output = buffer.getvalue()
-        else:
-            # Table format
-            table = format_dns_table(records)
-            console.print(table)
+        # Machine-readable formats never touch Rich renderables
+        if ctx.obj['output_json'] or output_format in ('json', 'ndjson', 'yaml', 'csv'):
+            stream_format = 'json' if ctx.obj['output_json'] else output_format
+
+            # Export or print, streaming records straight to the target
+            if export:
+                with open(export, 'w', newline='') as f:
+                    _write_records(records, stream_format, f)
+                console.print(f"[green]Records exported to {export}[/green]")
+            else:
+                _write_records(records, stream_format, click.get_text_stream('stdout'))
+            return
 
-            # Show summary
-            type_counts = {}
-            for record in records:
-                type_counts[record.type] = type_counts.get(record.type, 0) + 1
+        # Table format
+        table = format_dns_table(records)
+        console.print(table)
 
-            summary = Panel(
-                f"[bold]Total Records:[/bold] {len(records)}\n" +
-                "\n".join([f"[cyan]{t}:[/cyan] {c}" for t, c in sorted(type_counts.items())]),
-                title="Summary",
-                border_style="green"
-            )
-            console.print(summary)
-            return
+        # Show summary
+        type_counts = Counter(record.type for record in records)
 
-        # Export or print
-        if export:
-            with open(export, 'w') as f:
-                f.write(output)
-            console.print(f"[green]Records exported to {export}[/green]")
-        else:
-            console.print(output)
+        summary = Panel(
+            f"[bold]Total Records:[/bold] {len(records)}\n" +
+            "\n".join([f"[cyan]{t}:[/cyan] {c}" for t, c in sorted(type_counts.items())]),
+            title="Summary",
+            border_style="green"
+        )
+        console.print(summary)
 
     except GoDaddyDNSError as e:
-        UserFriendlyErrorHandler.display_error_with_suggestions(e, ctx.obj.get('debug', False))
-        if ctx.obj.get('debug'):
+        UserFriendlyErrorHandler.display_error_with_suggestions(e, debug)
+        if debug:
             UserFriendlyErrorHandler.suggest_alternative_commands("list", domain)
     except Exception as e:
         console.print(f"[red]Unexpected error: {e}[/red]")
-        if ctx.obj.get('debug'):
+        if debug:
             console.print_exception()
 
 @dns.command()
 @click.argument('domain')
-@click.argument('record_type', type=click.Choice([t.value for t in RecordType]))
+@click.argument('record_type', type=click.Choice(_RECORD_TYPE_VALUES))
 @click.argument('name')
 @click.argument('data')
 @click.option('--ttl', default=3600, type=int, help='TTL in seconds (default: 3600)')
@@ -157,6 +153,8 @@ def add(ctx, domain, record_type, name, data, ttl, priority, port, weight, confi
         console.print(f"[red]Invalid domain: {domain}[/red]")
         return
 
+    debug = ctx.obj.get('debug', False)
+
     if not validate_ttl(ttl):
         console.print(f"[red]Invalid TTL: {ttl} (must be between 300 and 86400)[/red]")
         return
@@ -183,31 +181,33 @@ def add(ctx, domain, record_type, name, data, ttl, priority, port, weight, confi
         weight=weight
     )
 
-    # Show what will be created
-    table = Table(title="DNS Record to Add", show_header=True)
-    table.add_column("Field", style="cyan")
-    table.add_column("Value", style="green")
-
-    table.add_row("Domain", domain)
-    table.add_row("Name", record.name)
-    table.add_row("Type", record.type)
-    table.add_row("Data", record.data)
-    table.add_row("TTL", str(record.ttl))
-    if record.priority:
-        table.add_row("Priority", str(record.priority))
-    if record.port:
-        table.add_row("Port", str(record.port))
-    if record.weight:
-        table.add_row("Weight", str(record.weight))
-
-    console.print(table)
-
-    if not confirm and not Confirm.ask("Create this DNS record?"):
-        console.print("[yellow]Operation cancelled[/yellow]")
-        return
+    # Scripted runs with --confirm skip the preview entirely
+    if not confirm:
+        # Show what will be created
+        table = Table(title="DNS Record to Add", show_header=True)
+        table.add_column("Field", style="cyan")
+        table.add_column("Value", style="green")
+
+        table.add_row("Domain", domain)
+        table.add_row("Name", record.name)
+        table.add_row("Type", record.type)
+        table.add_row("Data", record.data)
+        table.add_row("TTL", str(record.ttl))
+        if record.priority:
+            table.add_row("Priority", str(record.priority))
+        if record.port:
+            table.add_row("Port", str(record.port))
+        if record.weight:
+            table.add_row("Weight", str(record.weight))
+
+        console.print(table)
+
+        if not Confirm.ask("Create this DNS record?"):
+            console.print("[yellow]Operation cancelled[/yellow]")
+            return
 
     try:
-        client = SyncGoDaddyAPIClient(ctx.obj['auth'], ctx.obj['profile'])
+        client = _get_client(ctx)
         success = client.create_dns_record(domain, record)
 
         if success:
@@ -216,17 +216,17 @@ def add(ctx, domain, record_type, name, data, ttl, priority, port, weight, confi
             console.print(f"[red]✗ Failed to create DNS record[/red]")
 
     except GoDaddyDNSError as e:
-        UserFriendlyErrorHandler.display_error_with_suggestions(e, ctx.obj.get('debug', False))
-        if ctx.obj.get('debug'):
+        UserFriendlyErrorHandler.display_error_with_suggestions(e, debug)
+        if debug:
             UserFriendlyErrorHandler.suggest_alternative_commands("add", domain)
     except Exception as e:
         console.print(f"[red]Unexpected error: {e}[/red]")
-        if ctx.obj.get('debug'):
+        if debug:
             console.print_exception()
 
 @dns.command()
 @click.argument('domain')
-@click.argument('record_type', type=click.Choice([t.value for t in RecordType]))
+@click.argument('record_type', type=click.Choice(_RECORD_TYPE_VALUES))
 @click.argument('name')
 @click.option('--confirm', '-y', is_flag=True, help='Skip confirmation')
 @click.pass_context
@@ -242,30 +242,30 @@ def delete(ctx, domain, record_type, name, confirm):
         console.print(f"[red]Invalid domain: {domain}[/red]")
         return
 
+    debug = ctx.obj.get('debug', False)
+
     try:
         # First, show what will be deleted
-        client = SyncGoDaddyAPIClient(ctx.obj['auth'], ctx.obj['profile'])
-        existing_records = client.list_dns_records(domain, record_type)
+        client = _get_client(ctx)
+        # A single DELETE removes the whole record set, so only that set is fetched
+        existing_records = client.list_dns_records(domain, record_type, name)
         records_to_delete = [r for r in existing_records if r.name == name]
 
         if not records_to_delete:
             console.print(f"[yellow]No {record_type} records found for {name}.{domain}[/yellow]")
             return
 
-        # Show records to be deleted
-        table = format_dns_table(records_to_delete)
-        console.print(Panel(table, title="Records to Delete", border_style="red"))
+        if not confirm:
+            # Show records to be deleted
+            table = format_dns_table(records_to_delete)
+            console.print(Panel(table, title="Records to Delete", border_style="red"))
 
-        if not confirm and not Confirm.ask(f"Delete {len(records_to_delete)} record(s)?"):
-            console.print("[yellow]Operation cancelled[/yellow]")
-            return
+            if not Confirm.ask(f"Delete {len(records_to_delete)} record(s)?"):
+                console.print("[yellow]Operation cancelled[/yellow]")
+                return
 
         # Delete the record
-        success = await_result(
-            client._execute_with_client(
-                lambda c: c.delete_dns_record(domain, record_type, name)
-            )
-        )
+        success = client.delete_dns_record(domain, record_type, name)
 
         if success:
             console.print(f"[green]✓ DNS record(s) deleted successfully[/green]")
@@ -273,17 +273,17 @@ def delete(ctx, domain, record_type, name, confirm):
             console.print(f"[red]✗ Failed to delete DNS record(s)[/red]")
 
     except GoDaddyDNSError as e:
-        UserFriendlyErrorHandler.display_error_with_suggestions(e, ctx.obj.get('debug', False))
-        if ctx.obj.get('debug'):
+        UserFriendlyErrorHandler.display_error_with_suggestions(e, debug)
+        if debug:
             UserFriendlyErrorHandler.suggest_alternative_commands("delete", domain)
     except Exception as e:
         console.print(f"[red]Unexpected error: {e}[/red]")
-        if ctx.obj.get('debug'):
+        if debug:
             console.print_exception()
 
 @dns.command()
 @click.argument('domain')
-@click.argument('record_type', type=click.Choice([t.value for t in RecordType]))
+@click.argument('record_type', type=click.Choice(_RECORD_TYPE_VALUES))
 @click.argument('name')
 @click.argument('new_data')
 @click.option('--ttl', type=int, help='New TTL')
@@ -302,10 +302,12 @@ def update(ctx, domain, record_type, name, new_data, ttl, priority, confirm):
         console.print(f"[red]Invalid domain: {domain}[/red]")
         return
 
+    debug = ctx.obj.get('debug', False)
+
     try:
         # Get existing record
-        client = SyncGoDaddyAPIClient(ctx.obj['auth'], ctx.obj['profile'])
-        existing_records = client.list_dns_records(domain, record_type)
+        client = _get_client(ctx)
+        existing_records = client.list_dns_records(domain, record_type, name)
         target_records = [r for r in existing_records if r.name == name]
 
         if not target_records:
@@ -325,29 +327,26 @@ def update(ctx, domain, record_type, name, new_data, ttl, priority, confirm):
             priority=priority or old_record.priority
         )
 
-        comparison_table = Table(title="DNS Record Update", show_header=True)
-        comparison_table.add_column("Field", style="cyan")
-        comparison_table.add_column("Current", style="red")
-        comparison_table.add_column("New", style="green")
+        if not confirm:
+            comparison_table = Table(title="DNS Record Update", show_header=True)
+            comparison_table.add_column("Field", style="cyan")
+            comparison_table.add_column("Current", style="red")
+            comparison_table.add_column("New", style="green")
 
-        comparison_table.add_row("Data", old_record.data, new_record.data)
-        comparison_table.add_row("TTL", str(old_record.ttl), str(new_record.ttl))
-        if old_record.priority or new_record.priority:
-            comparison_table.add_row("Priority",
-                                   str(old_record.priority or 'None'),
-                                   str(new_record.priority or 'None'))
+            comparison_table.add_row("Data", old_record.data, new_record.data)
+            comparison_table.add_row("TTL", str(old_record.ttl), str(new_record.ttl))
+            if old_record.priority or new_record.priority:
+                comparison_table.add_row("Priority",
+                                       str(old_record.priority or 'None'),
+                                       str(new_record.priority or 'None'))
 
-        console.print(comparison_table)
+            console.print(comparison_table)
 
-        if not confirm and not Confirm.ask("Update this DNS record?"):
-            console.print("[yellow]Operation cancelled[/yellow]")
-            return
+            if not Confirm.ask("Update this DNS record?"):
+                console.print("[yellow]Operation cancelled[/yellow]")
+                return
 
-        success = await_result(
-            client._execute_with_client(
-                lambda c: c.update_dns_record(domain, new_record)
-            )
-        )
+        success = client.update_dns_record(domain, new_record)
 
         if success:
             console.print(f"[green]✓ DNS record updated successfully[/green]")
@@ -355,12 +354,12 @@ def update(ctx, domain, record_type, name, new_data, ttl, priority, confirm):
             console.print(f"[red]✗ Failed to update DNS record[/red]")
 
     except GoDaddyDNSError as e:
-        UserFriendlyErrorHandler.display_error_with_suggestions(e, ctx.obj.get('debug', False))
-        if ctx.obj.get('debug'):
+        UserFriendlyErrorHandler.display_error_with_suggestions(e, debug)
+        if debug:
             UserFriendlyErrorHandler.suggest_alternative_commands("update", domain)
     except Exception as e:
         console.print(f"[red]Unexpected error: {e}[/red]")
-        if ctx.obj.get('debug'):
+        if debug:
             console.print_exception()
 
 @dns.command()
@@ -380,44 +379,42 @@ def clear(ctx, domain, backup, confirm):
         return
 
     try:
-        client = SyncGoDaddyAPIClient(ctx.obj['auth'], ctx.obj['profile'])
+        client = _get_client(ctx)
         records = client.list_dns_records(domain)
 
         if not records:
             console.print(f"[yellow]No DNS records found for {domain}[/yellow]")
             return
 
-        # Show what will be deleted
-        table = format_dns_table(records)
-        console.print(Panel(table, title=f"All Records for {domain}", border_style="red"))
+        if not confirm:
+            # Show what will be deleted
+            table = format_dns_table(records)
+            console.print(Panel(table, title=f"All Records for {domain}", border_style="red"))
 
-        console.print(f"\n[bold red]WARNING: This will delete ALL {len(records)} DNS records for {domain}![/bold red]")
-        console.print("[red]This action cannot be undone![/red]")
+            console.print(f"\n[bold red]WARNING: This will delete ALL {len(records)} DNS records for {domain}![/bold red]")
+            console.print("[red]This action cannot be undone![/red]")
 
-        if backup:
-            console.print(f"[yellow]Records will be backed up to {backup}[/yellow]")
+            if backup:
+                console.print(f"[yellow]Records will be backed up to {backup}[/yellow]")
 
-        if not confirm and not Confirm.ask("Are you absolutely sure?"):
-            console.print("[yellow]Operation cancelled[/yellow]")
-            return
+            if not Confirm.ask("Are you absolutely sure?"):
+                console.print("[yellow]Operation cancelled[/yellow]")
+                return
 
         # Create backup if requested
         if backup:
             backup_data = {
                 'domain': domain,
                 'timestamp': time.time(),
-                'records': [r.__dict__ for r in records]
+                # Dataclasses go straight to the encoder (orjson serializes them natively)
+                'records': records
             }
             with open(backup, 'w') as f:
-                json.dump(backup_data, f, indent=2)
+                f.write(format_json_output(backup_data))
             console.print(f"[green]✓ Backup created at {backup}[/green]")
 
         # Clear all records by replacing with empty list
-        success = await_result(
-            client._execute_with_client(
-                lambda c: c.replace_all_records(domain, [])
-            )
-        )
+        success = client.replace_all_records(domain, [])
 
         if success:
             console.print(f"[green]✓ All DNS records cleared for {domain}[/green]")
@@ -430,13 +427,16 @@ def clear(ctx, domain, backup, confirm):
 @dns.command()
 @click.argument('domain')
 @click.option('--dry-run', is_flag=True, help='Show what would be validated without making changes')
+@click.option('--check-propagation', is_flag=True,
+              help='Compare stored records with answers from public resolvers')
 @click.pass_context
-def validate(ctx, domain, dry_run):
+def validate(ctx, domain, dry_run, check_propagation):
     """Validate DNS configuration for common issues
 
     Examples:
         godaddy dns validate example.com
         godaddy dns validate example.com --dry-run
+        godaddy dns validate example.com --check-propagation
     """
 
     if not validate_domain(domain):
@@ -444,49 +444,59 @@ def validate(ctx, domain, dry_run):
         return
 
     try:
-        client = SyncGoDaddyAPIClient(ctx.obj['auth'], ctx.obj['profile'])
-        records = client.list_dns_records(domain)
+        client = _get_client(ctx)
 
         issues = []
         warnings = []
         suggestions = []
 
-        # Check for common issues
-        a_records = [r for r in records if r.type == 'A']
-        aaaa_records = [r for r in records if r.type == 'AAAA']
-        mx_records = [r for r in records if r.type == 'MX']
-        cname_records = [r for r in records if r.type == 'CNAME']
+        # Bucket records by type and name in a single pass as pages stream in
+        by_type = {}
+        by_name = {}
+        low_ttl_count = 0
+        high_ttl_count = 0
+
+        def bucket(r):
+            nonlocal low_ttl_count, high_ttl_count
+            by_type.setdefault(r.type, []).append(r)
+            by_name.setdefault(r.name, []).append(r)
+            if r.ttl < 300:
+                low_ttl_count += 1
+            elif r.ttl > 86400:
+                high_ttl_count += 1
+
+        client.consume_dns_records(domain, bucket)
 
         # No A record for root domain
-        if not any(r.name == '@' for r in a_records):
+        if not any(r.type == 'A' for r in by_name.get('@', ())):
             issues.append("No A record for root domain (@)")
 
         # CNAME conflicts
-        for cname in cname_records:
-            conflicting = [r for r in records
-                         if r.name == cname.name and r.type != 'CNAME']
+        for cname in by_type.get('CNAME', ()):
+            conflicting = [r for r in by_name[cname.name] if r.type != 'CNAME']
             if conflicting:
                 issues.append(f"CNAME record '{cname.name}' conflicts with {len(conflicting)} other record(s)")
 
         # TTL recommendations
-        low_ttl_records = [r for r in records if r.ttl < 300]
-        if low_ttl_records:
-            warnings.append(f"{len(low_ttl_records)} record(s) have very low TTL (<300s)")
+        if low_ttl_count:
+            warnings.append(f"{low_ttl_count} record(s) have very low TTL (<300s)")
 
-        high_ttl_records = [r for r in records if r.ttl > 86400]
-        if high_ttl_records:
-            suggestions.append(f"{len(high_ttl_records)} record(s) have very high TTL (>24h)")
+        if high_ttl_count:
+            suggestions.append(f"{high_ttl_count} record(s) have very high TTL (>24h)")
 
         # MX record validation
-        if mx_records:
-            priorities = [r.priority for r in mx_records if r.priority]
-            if len(set(priorities)) != len(priorities):
-                warnings.append("Duplicate MX priorities found")
+        priority_counts = Counter(r.priority for r in by_type.get('MX', ()) if r.priority)
+        if any(count > 1 for count in priority_counts.values()):
+            warnings.append("Duplicate MX priorities found")
 
         # Missing common records
-        if not any(r.name == 'www' for r in records):
+        if 'www' not in by_name:
             suggestions.append("Consider adding a 'www' record")
 
+        # Live resolver answers vs. the stored zone
+        if check_propagation:
+            issues.extend(await_result(_check_zone_propagation(domain, by_type)))
+
         # Display results
         if issues:
             console.print(Panel(
@@ -519,12 +529,133 @@ def validate(ctx, domain, dry_run):
     except Exception as e:
         console.print(f"[red]Error validating DNS records: {e}[/red]")
 
-def await_result(coro):
-    """Helper to run async coroutine in sync context"""
+def _get_client(ctx) -> SyncGoDaddyAPIClient:
+    """Get the API client shared by DNS commands for this auth/profile
+
+    The client keeps its HTTP session open until the root context closes.
+    """
+    clients = ctx.obj.setdefault('_api_clients', {})
+    key = (id(ctx.obj['auth']), ctx.obj['profile'])
+    if key not in clients:
+        clients[key] = ctx.find_root().with_resource(
+            SyncGoDaddyAPIClient(ctx.obj['auth'], ctx.obj['profile'])
+        )
+    return clients[key]
+
+def _write_records(records, output_format, stream):
+    """Write records to a text stream one at a time as JSON, NDJSON, YAML or CSV"""
+    if output_format == 'ndjson':
+        # One compact object per line; uses orjson when installed
+        for record in records:
+            stream.write(format_json_output(asdict(record), pretty=False))
+            stream.write('\n')
+    elif output_format == 'csv':
+        import csv
+        from operator import attrgetter
+        writer = csv.writer(stream)
+        writer.writerow(['Name', 'Type', 'Data', 'TTL', 'Priority'])
+        fields = attrgetter('name', 'type', 'data', 'ttl', 'priority')
+        writer.writerows(
+            (name, rtype, data, ttl, priority or '')
+            for name, rtype, data, ttl, priority in map(fields, records)
+        )
+    elif output_format == 'yaml':
+        import yaml
+        # libyaml's C emitter when PyYAML was built with it
+        dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+        # Each single-item list dumps as one "- ..." entry of the overall sequence
+        for record in records:
+            yaml.dump([asdict(record)], stream, Dumper=dumper, default_flow_style=False)
+    else:
+        stream.write('[')
+        for i, record in enumerate(records):
+            stream.write(',\n  ' if i else '\n  ')
+            stream.write(json.dumps(asdict(record), default=str))
+        stream.write('\n]\n' if records else ']\n')
+
+PUBLIC_RESOLVERS = ('8.8.8.8', '1.1.1.1', '9.9.9.9')
+PROPAGATION_TYPES = ('A', 'AAAA', 'CNAME', 'MX', 'TXT')
+
+async def _check_propagation(name, rtype, timeout=3.0):
+    """Resolve name via all public resolvers, keeping the first answer to arrive
+
+    Returns the set of normalized answers, or None if no resolver replied.
+    """
+    import dns.asyncresolver
+    import dns.resolver
+
+    async def query(nameserver):
+        resolver = dns.asyncresolver.Resolver(configure=False)
+        resolver.nameservers = [nameserver]
+        resolver.lifetime = timeout
+        try:
+            answer = await resolver.resolve(name, rtype)
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            return set()
+        return {_rdata_value(rtype, rdata) for rdata in answer}
+
+    pending = {asyncio.ensure_future(query(ns)) for ns in PUBLIC_RESOLVERS}
     try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if not task.cancelled() and task.exception() is None:
+                    return task.result()
+        return None
+    finally:
+        # Drop the slower resolvers once a winner is in
+        for task in pending:
+            task.cancel()
+
+def _rdata_value(rtype, rdata):
+    """Normalize a resolver answer for comparison with stored record data"""
+    if rtype in ('A', 'AAAA'):
+        return rdata.address
+    if rtype == 'CNAME':
+        return rdata.target.to_text(omit_final_dot=True).lower()
+    if rtype == 'MX':
+        return rdata.exchange.to_text(omit_final_dot=True).lower()
+    return b''.join(rdata.strings).decode('utf-8', 'replace')
+
+def _record_value(domain, record):
+    """Normalize stored record data the same way as _rdata_value"""
+    if record.type in ('CNAME', 'MX'):
+        return domain if record.data == '@' else record.data.rstrip('.').lower()
+    if record.type in ('A', 'AAAA'):
+        # Resolvers answer in compressed lowercase form, e.g. 2001:db8::1
+        try:
+            return ipaddress.ip_address(record.data).compressed
+        except ValueError:
+            return record.data
+    return record.data
+
+async def _check_zone_propagation(domain, by_type):
+    """Check every stored record set against public resolvers concurrently"""
+    expected = {}
+    for rtype in PROPAGATION_TYPES:
+        for record in by_type.get(rtype, ()):
+            if '*' in record.name:
+                continue
+            fqdn = domain if record.name == '@' else f"{record.name}.{domain}"
+            expected.setdefault((fqdn, rtype), set()).add(_record_value(domain, record))
+
+    keys = tuple(expected)
+    answers = await asyncio.gather(*(_check_propagation(fqdn, rtype) for fqdn, rtype in keys))
+
+    issues = []
+    for (fqdn, rtype), observed in zip(keys, answers):
+        if observed is None:
+            issues.append(f"{rtype} {fqdn}: no public resolver answered")
+        elif observed != expected[(fqdn, rtype)]:
+            shown = ', '.join(sorted(observed)) or 'nothing'
+            issues.append(f"{rtype} {fqdn}: resolvers return {shown}, zone declares "
+                          f"{', '.join(sorted(expected[(fqdn, rtype)]))}")
+    return issues
 
-    return loop.run_until_complete(coro)
\ No newline at end of file
+def await_result(coro):
+    """Helper to run async coroutine in sync context
+
+    Shares the event loop used by SyncGoDaddyAPIClient so the cached
+    client's session is reused instead of bound to a throwaway loop.
+    """
+    return run_sync(coro)
@@ -4,26 +4,110 @@ A comprehensive health check for the GoDaddy DNS CLI system
 """
 
 import click
+import requests
 import sys
 import os
+import contextlib
+import functools
+import hashlib
+import importlib.metadata
+import importlib.util
 import json
 import platform
+import site
+import stat
 import subprocess
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
-from rich.console import Console
+from typing import Dict, List, Any, Optional, Tuple
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 from rich import box
 
+try:
+    import orjson
+except ImportError:  # optional C-accelerated parser
+    orjson = None
+
+try:
+    from packaging.version import Version
+except ImportError:  # not a declared dependency; fall back to numeric parsing
+    Version = None
+
 from godaddy_cli.core.config import ConfigManager
 from godaddy_cli.core.auth import AuthManager
 from godaddy_cli.core.simple_api_client import APIClient
-from godaddy_cli.utils.formatters import format_status_panel
+from godaddy_cli.utils.formatters import format_json_output, format_status_panel
 
 console = Console()
 
+API_HOST = 'api.godaddy.com'
+
+# Seconds a hostname resolution is reused within a diagnostics run
+DNS_CACHE_TTL = 60
+
+# Installed distribution names for modules whose import name differs
+DISTRIBUTION_NAMES = {'yaml': 'PyYAML'}
+
+# All diagnostic checks as (result name, SystemDiagnostics method, prerequisite checks)
+# in report order; a check is skipped when any prerequisite ends in an error
+CHECKS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ('python_environment', '_check_python_environment', ()),
+    ('package_installation', '_check_package_installation', ()),
+    ('configuration_files', '_check_configuration_files', ()),
+    ('credentials_security', '_check_credentials_security', ()),
+    ('api_connectivity', '_check_api_connectivity', ('credentials_security',)),
+    ('permissions', '_check_file_permissions', ()),
+    ('dependencies', '_check_dependencies', ()),
+    ('performance', '_check_performance', ()),
+    ('disk_space', '_check_disk_space', ()),
+    ('network_connectivity', '_check_network_connectivity', ()),
+)
+
+# Checks whose outcome only changes with the interpreter or installed packages
+CACHEABLE_CHECKS = ('python_environment', 'package_installation', 'dependencies')
+
+
+@functools.lru_cache(maxsize=None)
+def _psutil():
+    """Import psutil on first use, or return None if it is not installed
+
+    The doctor module is imported for every CLI invocation, so psutil is only
+    loaded once diagnostics actually run.
+    """
+    try:
+        import psutil
+    except ImportError:
+        return None
+
+    # Prime the CPU counters so the performance check can sample without blocking
+    psutil.cpu_percent(interval=None)
+    return psutil
+
+
+@functools.lru_cache(maxsize=1)
+def _system_info_snapshot() -> Dict[str, str]:
+    """Collect platform details once; they cannot change during the process"""
+    return {
+        'platform': platform.platform(),
+        'python_version': platform.python_version(),
+        'architecture': platform.architecture()[0],
+        'machine': platform.machine(),
+        'processor': platform.processor()
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_version(version: str):
+    """Parse a version string for comparison, raising ValueError if it can't be parsed"""
+    if Version is not None:
+        return Version(version)
+    return tuple(map(int, version.split('.')))
+
 
 @click.command()
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed diagnostic information')
@@ -51,22 +135,26 @@ def doctor(ctx, verbose, fix, export):
     """
     diagnostics = SystemDiagnostics(ctx.obj.get('config'), ctx.obj.get('auth'))
 
+    # Start the CPU usage window before the banner and checks
+    _psutil()
+
     console.print(Panel(
         "[bold cyan]GoDaddy DNS CLI System Diagnostics[/bold cyan]\n"
         "[dim]Checking system health and identifying potential issues...[/dim]",
         border_style="cyan"
     ))
 
-    # Run all diagnostic checks
-    results = diagnostics.run_all_checks(verbose=verbose, auto_fix=fix)
+    with diagnostics:
+        # Run all diagnostic checks
+        results = diagnostics.run_all_checks(verbose=verbose, auto_fix=fix)
 
-    # Display results
-    diagnostics.display_results(results, verbose=verbose)
+        # Display results
+        diagnostics.display_results(results, verbose=verbose)
 
-    # Export if requested
-    if export:
-        diagnostics.export_report(results, export)
-        console.print(f"\n[green]Diagnostic report exported to: {export}[/green]")
+        # Export if requested
+        if export:
+            diagnostics.export_report(results, export)
+            console.print(f"\n[green]Diagnostic report exported to: {export}[/green]")
 
     # Exit with appropriate code
     if results['overall_health'] == 'critical':
@@ -84,9 +172,59 @@ class SystemDiagnostics:
         self.config = config_manager
         self.auth = auth_manager
         self.checks = []
+        self._dns_cache: Dict[str, Tuple[float, str]] = {}
+        self._cached_creds: Optional[Tuple[str, str]] = None
+        self._api_client: Optional[APIClient] = None
+        self._session: Optional[requests.Session] = None
+        self._api_client_lock = threading.Lock()
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
+
+    def close(self):
+        """Close the HTTP sessions shared by this run's checks, if any were opened"""
+        if self._api_client is not None:
+            self._api_client.close()
+            self._api_client = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _http_session(self) -> requests.Session:
+        """Get a session for plain HTTPS probes, reusing the API client's when it is open"""
+        with self._api_client_lock:
+            if self._api_client is not None:
+                return self._api_client.session
+            if self._session is None:
+                self._session = requests.Session()
+            return self._session
+
+    def _get_credentials(self) -> Tuple[str, str]:
+        """Read API credentials once per run; each keyring lookup is a backend round trip"""
+        if self._cached_creds is None:
+            self._cached_creds = tuple(self.auth.get_credentials())
+        return self._cached_creds
+
+    def _get_api_client(self) -> APIClient:
+        """Get the API client shared by this run's checks, creating it on first use
+
+        One requests session means one TLS handshake for every API call doctor makes.
+        """
+        with self._api_client_lock:
+            if self._api_client is None:
+                api_key, api_secret = self._get_credentials()
+                self._api_client = APIClient(api_key, api_secret)
+            return self._api_client
 
     def run_all_checks(self, verbose: bool = False, auto_fix: bool = False) -> Dict[str, Any]:
         """Run all diagnostic checks and return comprehensive results"""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
         results = {
             'timestamp': self._get_timestamp(),
             'system_info': self._get_system_info(),
@@ -97,42 +235,84 @@ class SystemDiagnostics:
             'overall_health': 'healthy'
         }
 
-        # Define all diagnostic checks
-        checks = [
-            ('python_environment', self._check_python_environment),
-            ('package_installation', self._check_package_installation),
-            ('configuration_files', self._check_configuration_files),
-            ('credentials_security', self._check_credentials_security),
-            ('api_connectivity', self._check_api_connectivity),
-            ('permissions', self._check_file_permissions),
-            ('dependencies', self._check_dependencies),
-            ('performance', self._check_performance),
-            ('disk_space', self._check_disk_space),
-            ('network_connectivity', self._check_network_connectivity)
-        ]
-
-        # Run each check
-        for check_name, check_func in checks:
-            try:
-                console.print(f"[cyan]Checking {check_name.replace('_', ' ')}...[/cyan]")
-                check_result = check_func(verbose=verbose, auto_fix=auto_fix)
-                results['checks'][check_name] = check_result
-
-                if check_result['status'] == 'error':
-                    results['issues'].extend(check_result.get('issues', []))
-                elif check_result['status'] == 'warning':
-                    results['warnings'].extend(check_result.get('warnings', []))
-
-                if check_result.get('fixes_applied'):
-                    results['fixes_applied'].extend(check_result['fixes_applied'])
-
-            except Exception as e:
-                results['checks'][check_name] = {
-                    'status': 'error',
-                    'message': f'Check failed: {str(e)}',
-                    'issues': [f'Diagnostic check "{check_name}" crashed: {str(e)}']
-                }
-                results['issues'].append(f'Diagnostic check "{check_name}" crashed: {str(e)}')
+        checks = [(check_name, getattr(self, method_name), requires)
+                  for check_name, method_name, requires in CHECKS]
+
+        # Reuse environment checks from a previous run on the same installation
+        cache_key = self._environment_cache_key(verbose)
+        check_results = self._load_cache(cache_key)
+        waiting = [check for check in checks if check[0] not in check_results]
+        crashed = set()
+
+        # Run checks concurrently; most of them spend their time waiting on I/O
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True
+        ) as progress:
+            task = progress.add_task("[cyan]Running diagnostic checks...[/cyan]", total=len(waiting))
+
+            with ThreadPoolExecutor(max_workers=len(waiting)) as executor:
+                running = {}
+
+                while waiting or running:
+                    # Start checks whose prerequisites are done, skipping any whose prerequisites failed
+                    blocked = []
+                    for check_name, check_func, requires in waiting:
+                        if any(name not in check_results for name in requires):
+                            blocked.append((check_name, check_func, requires))
+                            continue
+
+                        failed = [name for name in requires
+                                  if check_results[name]['status'] in ('error', 'skipped')]
+                        if failed:
+                            check_results[check_name] = {
+                                'status': 'skipped',
+                                'message': f'Skipped: {", ".join(failed)} failed',
+                                'issues': [],
+                                'warnings': []
+                            }
+                            progress.update(task, advance=1)
+                        else:
+                            future = executor.submit(check_func, verbose=verbose, auto_fix=auto_fix)
+                            running[future] = check_name
+                    waiting = blocked
+
+                    if not running:
+                        continue
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        check_name = running.pop(future)
+                        try:
+                            check_results[check_name] = future.result()
+                        except Exception as e:
+                            crashed.add(check_name)
+                            check_results[check_name] = {
+                                'status': 'error',
+                                'message': f'Check failed: {str(e)}',
+                                'issues': [f'Diagnostic check "{check_name}" crashed: {str(e)}']
+                            }
+
+                        progress.update(task, advance=1,
+                                        description=f"[cyan]Checked {check_name.replace('_', ' ')}[/cyan]")
+
+        self._save_cache(cache_key, {name: result for name, result in check_results.items()
+                                     if name not in crashed})
+
+        # Merge in declaration order so the report does not depend on completion order
+        for check_name, _, _ in checks:
+            check_result = check_results[check_name]
+            results['checks'][check_name] = check_result
+
+            if check_result['status'] == 'error':
+                results['issues'].extend(check_result.get('issues', []))
+            elif check_result['status'] == 'warning':
+                results['warnings'].extend(check_result.get('warnings', []))
+
+            if check_result.get('fixes_applied'):
+                results['fixes_applied'].extend(check_result['fixes_applied'])
 
         # Determine overall health
         if results['issues']:
@@ -149,10 +329,10 @@ class SystemDiagnostics:
         result = {'status': 'healthy', 'details': {}, 'issues': [], 'warnings': []}
 
         # Check Python version
-        python_version = platform.python_version()
+        major, minor, micro = sys.version_info[:3]
+        python_version = f'{major}.{minor}.{micro}'
         result['details']['python_version'] = python_version
 
-        major, minor = map(int, python_version.split('.')[:2])
         if major < 3 or (major == 3 and minor < 8):
             result['status'] = 'error'
             result['issues'].append(f'Python {python_version} is too old. Requires Python 3.8+')
@@ -167,11 +347,10 @@ class SystemDiagnostics:
         if not in_venv:
             result['warnings'].append('Not running in a virtual environment. Consider using venv for dependency isolation.')
 
-        # Check pip
+        # Check pip via its metadata; importing pip itself is slow
         try:
-            import pip
-            result['details']['pip_version'] = pip.__version__
-        except ImportError:
+            result['details']['pip_version'] = importlib.metadata.version('pip')
+        except importlib.metadata.PackageNotFoundError:
             result['status'] = 'error'
             result['issues'].append('pip is not available. Cannot manage Python packages.')
 
@@ -186,14 +365,21 @@ class SystemDiagnostics:
             'click', 'requests', 'rich', 'keyring', 'pydantic', 'yaml', 'toml'
         ]
 
+        # Locate modules without executing them
         missing_modules = []
         for module in core_modules:
-            try:
-                __import__(module)
-                result['details'][f'{module}_available'] = True
-            except ImportError:
+            available = importlib.util.find_spec(module) is not None
+            result['details'][f'{module}_available'] = available
+
+            if not available:
                 missing_modules.append(module)
-                result['details'][f'{module}_available'] = False
+            elif verbose:
+                try:
+                    result['details'][f'{module}_version'] = importlib.metadata.version(
+                        DISTRIBUTION_NAMES.get(module, module)
+                    )
+                except importlib.metadata.PackageNotFoundError:
+                    result['details'][f'{module}_version'] = 'unknown'
 
         if missing_modules:
             result['status'] = 'error'
@@ -243,8 +429,11 @@ class SystemDiagnostics:
 
         # Validate config file structure
         try:
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
+            if orjson is not None:
+                config_data = orjson.loads(config_file.read_bytes())
+            else:
+                with open(config_file, 'r') as f:
+                    config_data = json.load(f)
 
             result['details']['config_valid_json'] = True
 
@@ -295,7 +484,7 @@ class SystemDiagnostics:
             if configured:
                 # Test credential retrieval (but don't expose them)
                 try:
-                    api_key, api_secret = self.auth.get_credentials()
+                    api_key, api_secret = self._get_credentials()
                     result['details']['credentials_retrievable'] = True
                     result['details']['api_key_length'] = len(api_key) if api_key else 0
                     result['details']['api_secret_length'] = len(api_secret) if api_secret else 0
@@ -333,34 +522,33 @@ class SystemDiagnostics:
 
         try:
             # Test API connection
-            api_key, api_secret = self.auth.get_credentials()
-
-            with APIClient(api_key, api_secret) as client:
-                # Test basic connectivity
-                start_time = self._get_timestamp()
-                connected = client.test_connection()
-                end_time = self._get_timestamp()
-
-                result['details']['api_reachable'] = connected
-                result['details']['response_time_ms'] = self._time_diff_ms(start_time, end_time)
-
-                if connected:
-                    # Try to get domains to test full authentication
-                    try:
-                        domains = client.get_domains()
-                        result['details']['authentication_valid'] = True
-                        result['details']['domains_count'] = len(domains)
-
-                        if len(domains) == 0:
-                            result['warnings'].append('API authentication works but no domains found in account')
-
-                    except Exception as e:
-                        result['status'] = 'error'
-                        result['issues'].append(f'API authentication failed: {e}')
-                        result['details']['authentication_valid'] = False
-                else:
+            client = self._get_api_client()
+
+            # Test basic connectivity
+            start_ns = time.perf_counter_ns()
+            connected = client.test_connection()
+            elapsed_ns = time.perf_counter_ns() - start_ns
+
+            result['details']['api_reachable'] = connected
+            result['details']['response_time_ms'] = elapsed_ns / 1e6
+
+            if connected:
+                # Try to get domains to test full authentication
+                try:
+                    domains = client.get_domains()
+                    result['details']['authentication_valid'] = True
+                    result['details']['domains_count'] = len(domains)
+
+                    if len(domains) == 0:
+                        result['warnings'].append('API authentication works but no domains found in account')
+
+                except Exception as e:
                     result['status'] = 'error'
-                    result['issues'].append('Cannot connect to GoDaddy API')
+                    result['issues'].append(f'API authentication failed: {e}')
+                    result['details']['authentication_valid'] = False
+            else:
+                result['status'] = 'error'
+                result['issues'].append('Cannot connect to GoDaddy API')
 
         except Exception as e:
             result['status'] = 'error'
@@ -379,16 +567,33 @@ class SystemDiagnostics:
 
         # Check config directory permissions
         config_dir = self.config.config_file.parent
-        result['details']['config_dir_exists'] = config_dir.exists()
-        result['details']['config_dir_writable'] = os.access(config_dir, os.W_OK) if config_dir.exists() else False
-        result['details']['config_dir_readable'] = os.access(config_dir, os.R_OK) if config_dir.exists() else False
+        try:
+            st = os.stat(config_dir)
+        except FileNotFoundError:
+            st = None
+
+        if st is None:
+            readable = writable = False
+        elif hasattr(os, 'geteuid') and os.geteuid() != 0 and st.st_uid == os.geteuid():
+            # Our own directory: the owner bits answer both questions from one
+            # stat(). Not for root, which mode bits do not restrict
+            readable = bool(st.st_mode & stat.S_IRUSR)
+            writable = bool(st.st_mode & stat.S_IWUSR)
+        else:
+            # Group/other permissions, ACLs or capabilities may apply
+            readable = os.access(config_dir, os.R_OK)
+            writable = os.access(config_dir, os.W_OK)
+
+        result['details']['config_dir_exists'] = st is not None
+        result['details']['config_dir_writable'] = writable
+        result['details']['config_dir_readable'] = readable
 
-        if config_dir.exists():
-            if not os.access(config_dir, os.W_OK):
+        if st is not None:
+            if not writable:
                 result['status'] = 'error'
                 result['issues'].append(f'Configuration directory is not writable: {config_dir}')
 
-            if not os.access(config_dir, os.R_OK):
+            if not readable:
                 result['status'] = 'error'
                 result['issues'].append(f'Configuration directory is not readable: {config_dir}')
         else:
@@ -419,8 +624,8 @@ class SystemDiagnostics:
 
         for dep_name, requirements in dependencies.items():
             try:
-                module = __import__(dep_name)
-                version = getattr(module, '__version__', 'unknown')
+                # Read the installed version from package metadata instead of importing
+                version = importlib.metadata.version(DISTRIBUTION_NAMES.get(dep_name, dep_name))
                 result['details'][f'{dep_name}_version'] = version
 
                 if version != 'unknown' and 'min_version' in requirements:
@@ -430,7 +635,7 @@ class SystemDiagnostics:
                             f'{dep_name} version {version} is below recommended {requirements["min_version"]}'
                         )
 
-            except ImportError:
+            except importlib.metadata.PackageNotFoundError:
                 result['status'] = 'error'
                 result['issues'].append(f'Required dependency {dep_name} is not installed')
 
@@ -440,8 +645,11 @@ class SystemDiagnostics:
         """Check performance-related metrics"""
         result = {'status': 'healthy', 'details': {}, 'issues': [], 'warnings': []}
 
-        import time
-        import psutil
+        psutil = _psutil()
+        if psutil is None:
+            result['status'] = 'warning'
+            result['warnings'].append('psutil is not installed; skipping memory and CPU checks')
+            return result
 
         # Check available memory
         memory = psutil.virtual_memory()
@@ -453,25 +661,15 @@ class SystemDiagnostics:
             result['warnings'].append(f'High memory usage: {memory.percent:.1f}%')
 
         # Check CPU usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        # Usage since _psutil() primed the counters; no 1s blocking sample.
+        # On a freshly started interpreter this can read 0.0.
+        cpu_percent = psutil.cpu_percent(interval=None)
         result['details']['cpu_usage_percent'] = cpu_percent
 
         if cpu_percent > 80:
             result['status'] = 'warning'
             result['warnings'].append(f'High CPU usage: {cpu_percent:.1f}%')
 
-        # Simple performance test
-        start_time = time.time()
-        for _ in range(1000):
-            pass  # Simple loop
-        end_time = time.time()
-
-        performance_score = 1000 / (end_time - start_time)
-        result['details']['performance_score'] = round(performance_score)
-
-        if performance_score < 10000:
-            result['warnings'].append('System performance appears slower than expected')
-
         return result
 
     def _check_disk_space(self, verbose: bool = False, auto_fix: bool = False) -> Dict[str, Any]:
@@ -509,21 +707,40 @@ class SystemDiagnostics:
         result = {'status': 'healthy', 'details': {}, 'issues': [], 'warnings': []}
 
         import socket
-        import urllib.request
+
+        def probe_dns():
+            try:
+                self._resolve_host(API_HOST)
+                return True
+            except socket.gaierror:
+                return False
+
+        def probe_https():
+            # HEAD skips the body; any non-5xx reply (401 included) proves connectivity
+            response = self._http_session().head(f'https://{API_HOST}', timeout=5,
+                                                 allow_redirects=False)
+            return response.status_code < 500
+
+        # Run both probes at once so a slow resolver doesn't stack on the HTTPS timeout
+        executor = ThreadPoolExecutor(max_workers=2)
+        dns_future = executor.submit(probe_dns)
+        https_future = executor.submit(probe_https)
+        wait((dns_future, https_future), timeout=6)
+        executor.shutdown(wait=False)
 
         # Test DNS resolution
-        try:
-            socket.gethostbyname('api.godaddy.com')
+        if dns_future.done() and dns_future.result():
             result['details']['dns_resolution'] = True
-        except socket.gaierror:
+        else:
             result['status'] = 'error'
-            result['issues'].append('Cannot resolve api.godaddy.com - DNS issues')
+            result['issues'].append(f'Cannot resolve {API_HOST} - DNS issues')
             result['details']['dns_resolution'] = False
 
         # Test HTTPS connectivity
         try:
-            with urllib.request.urlopen('https://api.godaddy.com', timeout=10) as response:
-                result['details']['https_connectivity'] = response.status == 200
+            if not https_future.done():
+                raise TimeoutError('timed out')
+            result['details']['https_connectivity'] = https_future.result()
         except Exception as e:
             result['status'] = 'warning'
             result['warnings'].append(f'HTTPS connectivity issue: {e}')
@@ -531,6 +748,70 @@ class SystemDiagnostics:
 
         return result
 
+    def _resolve_host(self, hostname: str) -> str:
+        """Resolve hostname, reusing a recent result from this run"""
+        import socket
+
+        cached = self._dns_cache.get(hostname)
+        if cached and time.monotonic() - cached[0] < DNS_CACHE_TTL:
+            return cached[1]
+
+        address = socket.gethostbyname(hostname)
+        self._dns_cache[hostname] = (time.monotonic(), address)
+        return address
+
+    def _cache_file(self) -> Path:
+        """Get the file holding cached environment check results"""
+        return self.config.config_dir / 'cache' / 'doctor.json'
+
+    def _environment_cache_key(self, verbose: bool) -> str:
+        """Hash the interpreter, site-packages state and CLI version"""
+        import godaddy_cli
+
+        parts = [sys.executable, getattr(godaddy_cli, '__version__', 'unknown'), str(verbose)]
+        # Older virtualenv builds of site.py lack getsitepackages()
+        for path in getattr(site, 'getsitepackages', lambda: [])():
+            try:
+                parts.append(f'{path}:{os.stat(path).st_mtime_ns}')
+            except OSError:
+                parts.append(f'{path}:missing')
+
+        return hashlib.blake2b('\0'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+    def _load_cache(self, cache_key: str) -> Dict[str, Dict[str, Any]]:
+        """Load cached check results if they were recorded for the same environment"""
+        if not self.config:
+            return {}
+
+        try:
+            with open(self._cache_file(), 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if cached.get('key') != cache_key:
+            return {}
+
+        return {name: result for name, result in cached.get('checks', {}).items()
+                if name in CACHEABLE_CHECKS}
+
+    def _save_cache(self, cache_key: str, check_results: Dict[str, Dict[str, Any]]):
+        """Persist cacheable check results; caching is best-effort and never fails the run"""
+        if not self.config:
+            return
+
+        try:
+            cache_file = self._cache_file()
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w') as f:
+                json.dump({
+                    'key': cache_key,
+                    'checks': {name: check_results[name] for name in CACHEABLE_CHECKS
+                               if name in check_results}
+                }, f, default=str)
+        except OSError:
+            pass
+
     def display_results(self, results: Dict[str, Any], verbose: bool = False):
         """Display diagnostic results in a user-friendly format"""
         # Overall health status
@@ -548,10 +829,11 @@ class SystemDiagnostics:
 
         overall_health = results['overall_health']
 
-        console.print(Panel(
+        # Collect every renderable and print them as one group in a single render pass
+        parts = [Panel(
             f"{health_icon[overall_health]} [bold {health_color[overall_health]}]System Health: {overall_health.upper()}[/bold {health_color[overall_health]}]",
             border_style=health_color[overall_health]
-        ))
+        )]
 
         # Summary table
         table = Table(title="Diagnostic Summary", box=box.ROUNDED)
@@ -561,7 +843,7 @@ class SystemDiagnostics:
 
         for check_name, check_result in results['checks'].items():
             status = check_result['status']
-            status_icon = '✅' if status == 'healthy' else '⚠️' if status == 'warning' else '❌'
+            status_icon = {'healthy': '✅', 'warning': '⚠️', 'skipped': '⏭️'}.get(status, '❌')
             status_text = f"{status_icon} {status.title()}"
 
             details = check_result.get('message', '')
@@ -575,18 +857,18 @@ class SystemDiagnostics:
                 details
             )
 
-        console.print(table)
+        parts.append(table)
 
         # Issues and warnings
         if results['issues']:
-            console.print(Panel(
+            parts.append(Panel(
                 '\n'.join([f"• {issue}" for issue in results['issues']]),
                 title="[bold red]Critical Issues[/bold red]",
                 border_style="red"
             ))
 
         if results['warnings']:
-            console.print(Panel(
+            parts.append(Panel(
                 '\n'.join([f"• {warning}" for warning in results['warnings']]),
                 title="[bold yellow]Warnings[/bold yellow]",
                 border_style="yellow"
@@ -594,17 +876,21 @@ class SystemDiagnostics:
 
         # Fixes applied
         if results['fixes_applied']:
-            console.print(Panel(
+            parts.append(Panel(
                 '\n'.join([f"✅ {fix}" for fix in results['fixes_applied']]),
                 title="[bold green]Fixes Applied[/bold green]",
                 border_style="green"
             ))
 
         # Recommendations
-        self._show_recommendations(results)
+        recommendations = self._build_recommendations(results)
+        if recommendations is not None:
+            parts.append(recommendations)
+
+        console.print(Group(*parts))
 
-    def _show_recommendations(self, results: Dict[str, Any]):
-        """Show recommendations based on diagnostic results"""
+    def _build_recommendations(self, results: Dict[str, Any]) -> Optional[Panel]:
+        """Build a recommendations panel based on diagnostic results, if any apply"""
         recommendations = []
 
         if results['overall_health'] == 'critical':
@@ -625,19 +911,26 @@ class SystemDiagnostics:
         if 'configuration_files' in checks and checks['configuration_files']['status'] != 'healthy':
             recommendations.append("⚙️ Run 'godaddy doctor --fix' to repair configuration files")
 
-        if recommendations:
-            console.print(Panel(
-                '\n'.join(recommendations),
-                title="[bold blue]Recommendations[/bold blue]",
-                border_style="blue"
-            ))
+        if not recommendations:
+            return None
+
+        return Panel(
+            '\n'.join(recommendations),
+            title="[bold blue]Recommendations[/bold blue]",
+            border_style="blue"
+        )
 
     def export_report(self, results: Dict[str, Any], filepath: str):
-        """Export diagnostic report to file"""
+        """Export diagnostic report to file, replacing any existing file atomically"""
+        target = Path(filepath)
+        tmp_file = target.with_name(target.name + '.tmp')
         try:
-            with open(filepath, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            # format_json_output uses orjson when installed
+            tmp_file.write_bytes(format_json_output(results).encode('utf-8'))
+            os.replace(tmp_file, target)
         except Exception as e:
+            with contextlib.suppress(OSError):
+                tmp_file.unlink()
             console.print(f"[red]Failed to export report: {e}[/red]")
 
     def _get_timestamp(self) -> str:
@@ -647,27 +940,11 @@ class SystemDiagnostics:
 
     def _get_system_info(self) -> Dict[str, str]:
         """Get basic system information"""
-        return {
-            'platform': platform.platform(),
-            'python_version': platform.python_version(),
-            'architecture': platform.architecture()[0],
-            'machine': platform.machine(),
-            'processor': platform.processor()
-        }
-
-    def _time_diff_ms(self, start: str, end: str) -> float:
-        """Calculate time difference in milliseconds"""
-        from datetime import datetime
-        start_dt = datetime.fromisoformat(start)
-        end_dt = datetime.fromisoformat(end)
-        return (end_dt - start_dt).total_seconds() * 1000
+        return dict(_system_info_snapshot())
 
     def _version_less_than(self, current: str, minimum: str) -> bool:
         """Compare version strings"""
-        def parse_version(v):
-            return tuple(map(int, v.split('.')))
-
         try:
-            return parse_version(current) < parse_version(minimum)
-        except:
+            return _parse_version(current) < _parse_version(minimum)
+        except ValueError:
             return False  # If we can't parse, assume it's ok
\ No newline at end of file
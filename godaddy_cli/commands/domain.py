@@ -3,14 +3,57 @@ Domain management commands
 """
 
 import click
-from typing import Optional
+import functools
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional
 
 from godaddy_cli.core.api_client import SyncGoDaddyAPIClient
 from godaddy_cli.core.exceptions import APIError, ValidationError
-from godaddy_cli.utils.formatters import format_domain_table, format_json_output, format_status_panel
 from godaddy_cli.utils.validators import validate_domain
 
 
+@functools.lru_cache(maxsize=None)
+def _rich() -> SimpleNamespace:
+    """Import the Rich pieces used for table output on first use"""
+    from rich import box
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+
+    return SimpleNamespace(Console=Console, Panel=Panel, Table=Table, Text=Text, box=box)
+
+
+@functools.lru_cache(maxsize=None)
+def _formatters() -> Dict[str, Callable[[Any], str]]:
+    """Formatter for each structured output format, imported on first use"""
+    from godaddy_cli.utils.formatters import format_json_output, format_yaml_output
+
+    return {
+        'json': format_json_output,
+        'yaml': format_yaml_output,
+    }
+
+
+def _format_output(output_format: str, data: Any) -> str:
+    """Render data with the formatter registered for output_format"""
+    return _formatters()[output_format](data)
+
+
+def _domain_to_dict(domain_info) -> Dict[str, Any]:
+    """Plain-data view of a Domain for JSON/YAML output"""
+    return {
+        'domain': domain_info.domain,
+        'status': domain_info.status,
+        'expires': domain_info.expires,
+        'created': domain_info.created,
+        'nameservers': domain_info.nameservers,
+        'privacy': domain_info.privacy,
+        'locked': domain_info.locked
+    }
+
+
 @click.group(name='domains')
 @click.pass_context
 def domains_group(ctx):
@@ -23,11 +66,15 @@ def domains_group(ctx):
               default='table', help='Output format')
 @click.option('--status', help='Filter by domain status')
 @click.option('--limit', type=int, help='Limit number of results')
+@click.option('--cache', is_flag=True, help='Reuse API responses cached by earlier runs')
 @click.pass_context
-def list_domains(ctx, output_format: str, status: Optional[str], limit: Optional[int]):
+def list_domains(ctx, output_format: str, status: Optional[str], limit: Optional[int],
+                 cache: bool):
     """List all domains in your account"""
+    from godaddy_cli.utils.formatters import format_domain_table, format_status_panel
+
     try:
-        client = SyncGoDaddyAPIClient(ctx.obj['auth'])
+        client = SyncGoDaddyAPIClient(ctx.obj['auth'], use_cache=cache)
         domains = client.list_domains()
 
         # Apply filters
@@ -44,35 +91,9 @@ def list_domains(ctx, output_format: str, status: Optional[str], limit: Optional
         # Format output
         if output_format == 'table':
             click.echo(format_domain_table(domains))
-        elif output_format == 'json':
-            domain_data = [
-                {
-                    'domain': d.domain,
-                    'status': d.status,
-                    'expires': d.expires,
-                    'created': d.created,
-                    'nameservers': d.nameservers,
-                    'privacy': d.privacy,
-                    'locked': d.locked
-                }
-                for d in domains
-            ]
-            click.echo(format_json_output(domain_data))
-        elif output_format == 'yaml':
-            from godaddy_cli.utils.formatters import format_yaml_output
-            domain_data = [
-                {
-                    'domain': d.domain,
-                    'status': d.status,
-                    'expires': d.expires,
-                    'created': d.created,
-                    'nameservers': d.nameservers,
-                    'privacy': d.privacy,
-                    'locked': d.locked
-                }
-                for d in domains
-            ]
-            click.echo(format_yaml_output(domain_data))
+            return
+
+        click.echo(_format_output(output_format, [_domain_to_dict(d) for d in domains]))
 
     except APIError as e:
         click.echo(format_status_panel('error', f'API Error: {e.message}'), err=True)
@@ -86,23 +107,23 @@ def list_domains(ctx, output_format: str, status: Optional[str], limit: Optional
 @click.argument('domain')
 @click.option('--format', 'output_format', type=click.Choice(['table', 'json', 'yaml']),
               default='table', help='Output format')
+@click.option('--cache', is_flag=True, help='Reuse API responses cached by earlier runs')
 @click.pass_context
-def domain_info(ctx, domain: str, output_format: str):
+def domain_info(ctx, domain: str, output_format: str, cache: bool):
     """Get detailed information about a specific domain"""
+    from godaddy_cli.utils.formatters import format_status_panel
+
     try:
         validate_domain(domain)
 
-        client = SyncGoDaddyAPIClient(ctx.obj['auth'])
+        client = SyncGoDaddyAPIClient(ctx.obj['auth'], use_cache=cache)
         domain_info = client.get_domain(domain)
 
         if output_format == 'table':
-            from rich.console import Console
-            from rich.panel import Panel
-            from rich.text import Text
+            rich = _rich()
+            console = rich.Console()
 
-            console = Console()
-
-            info_text = Text()
+            info_text = rich.Text()
             info_text.append(f"Domain: {domain_info.domain}\n", style="cyan bold")
             info_text.append(f"Status: {domain_info.status}\n", style="magenta")
             info_text.append(f"Created: {domain_info.created}\n", style="yellow")
@@ -112,36 +133,13 @@ def domain_info(ctx, domain: str, output_format: str):
 
             if domain_info.nameservers:
                 info_text.append("\nNameservers:\n", style="blue bold")
-                for ns in domain_info.nameservers:
-                    info_text.append(f"• {ns}\n", style="white")
+                info_text.append("".join(f"• {ns}\n" for ns in domain_info.nameservers), style="white")
 
-            panel = Panel(info_text, title="Domain Information", border_style="blue")
+            panel = rich.Panel(info_text, title="Domain Information", border_style="blue")
             console.print(panel)
 
-        elif output_format == 'json':
-            domain_data = {
-                'domain': domain_info.domain,
-                'status': domain_info.status,
-                'expires': domain_info.expires,
-                'created': domain_info.created,
-                'nameservers': domain_info.nameservers,
-                'privacy': domain_info.privacy,
-                'locked': domain_info.locked
-            }
-            click.echo(format_json_output(domain_data))
-
-        elif output_format == 'yaml':
-            from godaddy_cli.utils.formatters import format_yaml_output
-            domain_data = {
-                'domain': domain_info.domain,
-                'status': domain_info.status,
-                'expires': domain_info.expires,
-                'created': domain_info.created,
-                'nameservers': domain_info.nameservers,
-                'privacy': domain_info.privacy,
-                'locked': domain_info.locked
-            }
-            click.echo(format_yaml_output(domain_data))
+        else:
+            click.echo(_format_output(output_format, _domain_to_dict(domain_info)))
 
     except ValidationError as e:
         click.echo(format_status_panel('error', f'Validation Error: {str(e)}'), err=True)
@@ -156,13 +154,16 @@ def domain_info(ctx, domain: str, output_format: str):
 
 @domains_group.command('status')
 @click.argument('domain')
+@click.option('--cache', is_flag=True, help='Reuse API responses cached by earlier runs')
 @click.pass_context
-def domain_status(ctx, domain: str):
+def domain_status(ctx, domain: str, cache: bool):
     """Check domain status and health"""
+    from godaddy_cli.utils.formatters import format_status_panel
+
     try:
         validate_domain(domain)
 
-        client = SyncGoDaddyAPIClient(ctx.obj['auth'])
+        client = SyncGoDaddyAPIClient(ctx.obj['auth'], use_cache=cache)
         domain_info = client.get_domain(domain)
 
         # Basic status check
@@ -174,10 +175,11 @@ def domain_status(ctx, domain: str):
 
         # Check expiration
         if domain_info.expires:
-            from datetime import datetime, timezone
-            try:
-                expires_date = datetime.fromisoformat(domain_info.expires.replace('Z', '+00:00'))
-                days_until_expiry = (expires_date - datetime.now(timezone.utc)).days
+            expires_ts = domain_info.expires_ts
+            if expires_ts is None:
+                click.echo(format_status_panel('info', f'Expires: {domain_info.expires}'))
+            else:
+                days_until_expiry = int((expires_ts - time.time()) // 86400)
 
                 if days_until_expiry < 30:
                     click.echo(format_status_panel(
@@ -189,8 +191,6 @@ def domain_status(ctx, domain: str):
                         'info',
                         f'Domain expires in {days_until_expiry} days'
                     ))
-            except Exception:
-                click.echo(format_status_panel('info', f'Expires: {domain_info.expires}'))
 
         # Check security settings
         if not domain_info.privacy:
@@ -215,13 +215,17 @@ def domain_status(ctx, domain: str):
 @click.option('--set', 'new_nameservers', multiple=True, help='Set new nameservers')
 @click.option('--format', 'output_format', type=click.Choice(['table', 'json', 'yaml']),
               default='table', help='Output format')
+@click.option('--cache', is_flag=True, help='Reuse API responses cached by earlier runs')
 @click.pass_context
-def manage_nameservers(ctx, domain: str, new_nameservers: tuple, output_format: str):
+def manage_nameservers(ctx, domain: str, new_nameservers: tuple, output_format: str,
+                       cache: bool):
     """Manage domain nameservers"""
+    from godaddy_cli.utils.formatters import format_status_panel
+
     try:
         validate_domain(domain)
 
-        client = SyncGoDaddyAPIClient(ctx.obj['auth'])
+        client = SyncGoDaddyAPIClient(ctx.obj['auth'], use_cache=cache)
 
         if new_nameservers:
             # Set new nameservers
@@ -243,33 +247,22 @@ def manage_nameservers(ctx, domain: str, new_nameservers: tuple, output_format:
         domain_info = client.get_domain(domain)
 
         if output_format == 'table':
-            from rich.console import Console
-            from rich.table import Table
-            from rich import box
-
-            table = Table(title=f"Nameservers for {domain}", box=box.ROUNDED)
+            rich = _rich()
+            table = rich.Table(title=f"Nameservers for {domain}", box=rich.box.ROUNDED)
             table.add_column("Nameserver", style="cyan")
 
             for ns in domain_info.nameservers or []:
                 table.add_row(ns)
 
-            console = Console()
+            console = rich.Console()
             console.print(table)
 
-        elif output_format == 'json':
-            nameserver_data = {
-                'domain': domain,
-                'nameservers': domain_info.nameservers or []
-            }
-            click.echo(format_json_output(nameserver_data))
-
-        elif output_format == 'yaml':
-            from godaddy_cli.utils.formatters import format_yaml_output
+        else:
             nameserver_data = {
                 'domain': domain,
                 'nameservers': domain_info.nameservers or []
             }
-            click.echo(format_yaml_output(nameserver_data))
+            click.echo(_format_output(output_format, nameserver_data))
 
     except ValidationError as e:
         click.echo(format_status_panel('error', f'Validation Error: {str(e)}'), err=True)
@@ -3,14 +3,14 @@ DNS export commands
 """
 
 import click
+import functools
 import json
 import csv
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, TextIO
 from datetime import datetime
+from pathlib import Path
 
-from godaddy_cli.core.api_client import SyncGoDaddyAPIClient
 from godaddy_cli.core.exceptions import APIError, ValidationError
-from godaddy_cli.utils.formatters import format_status_panel, format_json_output, format_yaml_output, format_csv_output
 from godaddy_cli.utils.validators import validate_domain, validate_file_path
 
 
@@ -28,59 +28,37 @@ def export_group(ctx):
               default='json', help='Export format')
 @click.option('--type', 'record_type', help='Filter by record type')
 @click.option('--name', 'record_name', help='Filter by record name')
+@click.option('--cache', is_flag=True, help='Reuse API responses cached by earlier runs')
 @click.pass_context
 def export_dns(ctx, domain: str, output: Optional[str], output_format: str,
-               record_type: Optional[str], record_name: Optional[str]):
+               record_type: Optional[str], record_name: Optional[str], cache: bool):
     """Export DNS records for a domain"""
+    from godaddy_cli.utils.formatters import format_status_panel
+
     try:
         validate_domain(domain)
 
-        client = SyncGoDaddyAPIClient(ctx.obj['auth'])
+        from godaddy_cli.core.api_client import SyncGoDaddyAPIClient
+        client = SyncGoDaddyAPIClient(ctx.obj['auth'], use_cache=cache)
         records = client.list_dns_records(domain, record_type, record_name)
 
         if not records:
             click.echo(format_status_panel('info', f'No DNS records found for {domain}'))
             return
 
-        # Create export data
-        export_data = {
-            'domain': domain,
-            'export_date': datetime.now().isoformat(),
-            'total_records': len(records),
-            'filters': {
-                'type': record_type,
-                'name': record_name
-            },
-            'records': [
-                {
-                    'name': r.name,
-                    'type': r.type,
-                    'data': r.data,
-                    'ttl': r.ttl,
-                    'priority': r.priority,
-                    'weight': r.weight,
-                    'port': r.port
-                }
-                for r in records
-            ]
-        }
-
-        # Format output
-        if output_format == 'json':
-            content = format_json_output(export_data)
-        elif output_format == 'yaml':
-            content = format_yaml_output(export_data)
-        elif output_format == 'csv':
-            content = format_csv_output(records)
+        export_date = datetime.now().isoformat()
+        filters = {'type': record_type, 'name': record_name}
 
-        # Write to file or stdout
+        # Stream to file or stdout
         if output:
             validate_file_path(output)
-            with open(output, 'w') as f:
-                f.write(content)
+            with open(output, 'w', newline='') as f:
+                _write_export(f, output_format, domain, export_date, records, filters)
             click.echo(format_status_panel('success', f'Exported {len(records)} records to {output}'))
         else:
-            click.echo(content)
+            _write_export(click.get_text_stream('stdout'), output_format, domain, export_date,
+                          records, filters)
+            click.echo()
 
     except ValidationError as e:
         click.echo(format_status_panel('error', f'Validation Error: {str(e)}'), err=True)
@@ -97,15 +75,19 @@ def export_dns(ctx, domain: str, output: Optional[str], output_format: str,
 @click.option('--output-dir', '-d', default='.', help='Output directory')
 @click.option('--format', 'output_format', type=click.Choice(['json', 'yaml', 'csv']),
               default='json', help='Export format')
+@click.option('--cache', is_flag=True, help='Reuse API responses cached by earlier runs')
+@click.option('--concurrency', type=click.IntRange(1, 32), default=8,
+              help='Number of domains fetched in parallel')
 @click.pass_context
-def export_all(ctx, output_dir: str, output_format: str):
+def export_all(ctx, output_dir: str, output_format: str, cache: bool, concurrency: int):
     """Export DNS records for all domains"""
-    try:
-        import os
+    from godaddy_cli.utils.formatters import format_status_panel
 
+    try:
         validate_file_path(output_dir)
 
-        client = SyncGoDaddyAPIClient(ctx.obj['auth'])
+        from godaddy_cli.core.api_client import SyncGoDaddyAPIClient
+        client = SyncGoDaddyAPIClient(ctx.obj['auth'], use_cache=cache)
         domains = client.list_domains()
 
         if not domains:
@@ -113,52 +95,36 @@ def export_all(ctx, output_dir: str, output_format: str):
             return
 
         exported_count = 0
+        out_dir = Path(output_dir)
+        # One timestamp for the whole run keeps the files of a single export together
+        started = datetime.now()
+        timestamp = started.strftime('%Y%m%d_%H%M%S')
+        export_date = started.isoformat()
 
-        for domain in domains:
-            try:
-                records = client.list_dns_records(domain.domain)
+        # Fetches overlap on one session, so they all share its rate limiter;
+        # concurrency caps how many requests are in flight at once
+        results = client.list_dns_records_for_domains([d.domain for d in domains], concurrency)
+
+        for domain, records in results.items():
+            if isinstance(records, Exception):
+                click.echo(f"Failed to export {domain}: {str(records)}", err=True)
+                continue
 
+            try:
                 if records:
                     # Create filename
-                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    filename = f"dns_export_{domain.domain}_{timestamp}.{output_format}"
-                    filepath = os.path.join(output_dir, filename)
-
-                    # Create export data
-                    export_data = {
-                        'domain': domain.domain,
-                        'export_date': datetime.now().isoformat(),
-                        'total_records': len(records),
-                        'records': [
-                            {
-                                'name': r.name,
-                                'type': r.type,
-                                'data': r.data,
-                                'ttl': r.ttl,
-                                'priority': r.priority,
-                                'weight': r.weight,
-                                'port': r.port
-                            }
-                            for r in records
-                        ]
-                    }
-
-                    # Format and write
-                    if output_format == 'json':
-                        content = format_json_output(export_data)
-                    elif output_format == 'yaml':
-                        content = format_yaml_output(export_data)
-                    elif output_format == 'csv':
-                        content = format_csv_output(records)
-
-                    with open(filepath, 'w') as f:
-                        f.write(content)
+                    filename = f"dns_export_{domain}_{timestamp}.{output_format}"
+                    filepath = out_dir / filename
+
+                    # A large buffer turns big exports into a few write syscalls
+                    with filepath.open('w', newline='', buffering=1 << 20) as f:
+                        _write_export(f, output_format, domain, export_date, records)
 
                     exported_count += 1
-                    click.echo(f"Exported {len(records)} records for {domain.domain}")
+                    click.echo(f"Exported {len(records)} records for {domain}")
 
             except Exception as e:
-                click.echo(f"Failed to export {domain.domain}: {str(e)}", err=True)
+                click.echo(f"Failed to export {domain}: {str(e)}", err=True)
 
         click.echo(format_status_panel('success', f'Exported DNS records for {exported_count} domains'))
 
@@ -170,6 +136,49 @@ def export_all(ctx, output_dir: str, output_format: str):
         ctx.exit(1)
 
 
+@functools.lru_cache(maxsize=None)
+def _document_writers() -> Dict[str, Callable[[Any, TextIO], None]]:
+    """Stream writer for each document format, imported on first use"""
+    from godaddy_cli.utils.formatters import write_json_output, write_yaml_output
+
+    return {
+        'json': write_json_output,
+        'yaml': write_yaml_output,
+    }
+
+
+def _write_export(stream: TextIO, output_format: str, domain: str, export_date: str,
+                  records: List[Any], filters: Optional[Dict[str, Any]] = None) -> None:
+    """Serialize an export straight into an open text stream"""
+    if output_format == 'csv':
+        # CSV carries only the records, so the export document is never built
+        from godaddy_cli.utils.formatters import write_csv_output
+        write_csv_output(records, stream)
+        return
+
+    export_data = {
+        'domain': domain,
+        'export_date': export_date,
+        'total_records': len(records)
+    }
+    if filters is not None:
+        export_data['filters'] = filters
+    export_data['records'] = [
+        {
+            'name': r.name,
+            'type': r.type,
+            'data': r.data,
+            'ttl': r.ttl,
+            'priority': r.priority,
+            'weight': r.weight,
+            'port': r.port
+        }
+        for r in records
+    ]
+
+    _document_writers()[output_format](export_data, stream)
+
+
 def register_commands(cli):
     """Register export commands with the main CLI"""
     cli.add_command(export_group)
\ No newline at end of file
@@ -6,14 +6,17 @@ import click
 import json
 import csv
 import os
-from typing import Optional, List, Dict, Any
-from io import StringIO
+from typing import Optional, List, Dict, Any, TextIO, TYPE_CHECKING
 
-from godaddy_cli.core.api_client import SyncGoDaddyAPIClient, DNSRecord
 from godaddy_cli.core.exceptions import APIError, ValidationError
-from godaddy_cli.utils.formatters import format_status_panel, format_bulk_operation_summary
 from godaddy_cli.utils.validators import validate_domain, validate_file_path, validate_batch_size
 
+if TYPE_CHECKING:
+    from godaddy_cli.core.api_client import DNSRecord
+
+# Imports larger than this validate in a process pool
+PARALLEL_VALIDATION_THRESHOLD = 1000
+
 
 @click.group(name='import')
 @click.pass_context
@@ -30,10 +33,17 @@ def import_group(ctx):
 @click.option('--dry-run', is_flag=True, help='Validate without applying changes')
 @click.option('--batch-size', type=int, default=10, help='Batch size for bulk operations')
 @click.option('--force', is_flag=True, help='Force import without confirmation')
+@click.option('--strict', is_flag=True,
+              help='Fully validate record data locally (always on with --dry-run)')
+@click.option('--parallel-batches', type=click.IntRange(1, 10), default=1,
+              help='Number of batches sent concurrently')
 @click.pass_context
 def import_dns(ctx, domain: str, file_path: str, input_format: Optional[str],
-               dry_run: bool, batch_size: int, force: bool):
+               dry_run: bool, batch_size: int, force: bool, strict: bool,
+               parallel_batches: int):
     """Import DNS records from file"""
+    from godaddy_cli.utils.formatters import format_status_panel, format_bulk_operation_summary
+
     try:
         validate_domain(domain)
         validate_file_path(file_path)
@@ -53,11 +63,9 @@ def import_dns(ctx, domain: str, file_path: str, input_format: Optional[str],
             else:
                 raise ValidationError("Cannot auto-detect format. Please specify --format")
 
-        # Read and parse file
-        with open(file_path, 'r') as f:
-            content = f.read()
-
-        records = _parse_records(content, input_format)
+        # Parse straight from the open file
+        with open(file_path, 'r', newline='') as f:
+            records = _parse_records(f, input_format)
 
         if not records:
             click.echo(format_status_panel('info', 'No records found in file'))
@@ -65,13 +73,9 @@ def import_dns(ctx, domain: str, file_path: str, input_format: Optional[str],
 
         click.echo(f"Found {len(records)} records to import")
 
-        # Validate records
-        validation_errors = []
-        for i, record in enumerate(records):
-            try:
-                record.validate()
-            except Exception as e:
-                validation_errors.append(f"Record {i+1}: {str(e)}")
+        # The API re-validates record data, so the full local pass is only needed
+        # when this run is the only check the records get
+        validation_errors = _validate_records(records, strict=strict or dry_run)
 
         if validation_errors:
             click.echo(format_status_panel('error', 'Validation failed:'), err=True)
@@ -92,11 +96,12 @@ def import_dns(ctx, domain: str, file_path: str, input_format: Optional[str],
                 return
 
         # Perform import
+        from godaddy_cli.core.api_client import SyncGoDaddyAPIClient
         client = SyncGoDaddyAPIClient(ctx.obj['auth'])
 
         with click.progressbar(length=len(records), label='Importing records') as bar:
-            results = client.bulk_update_records(domain, records, batch_size)
-            bar.update(len(records))
+            results = client.bulk_update_records(domain, records, batch_size, on_progress=bar.update,
+                                                 concurrency=parallel_batches)
 
         # Display results
         click.echo(format_bulk_operation_summary(results))
@@ -126,6 +131,8 @@ def import_dns(ctx, domain: str, file_path: str, input_format: Optional[str],
 def import_template(ctx, domain: str, template_file: str, vars: tuple,
                     vars_file: Optional[str], dry_run: bool, force: bool):
     """Import DNS records from template"""
+    from godaddy_cli.utils.formatters import format_status_panel, format_bulk_operation_summary
+
     try:
         validate_domain(domain)
         validate_file_path(template_file)
@@ -138,8 +145,7 @@ def import_template(ctx, domain: str, template_file: str, vars: tuple,
             if template_file.endswith('.json'):
                 template_data = json.load(f)
             else:
-                import yaml
-                template_data = yaml.safe_load(f)
+                template_data = _load_yaml(f)
 
         # Load variables
         template_vars = {'domain': domain}
@@ -161,12 +167,12 @@ def import_template(ctx, domain: str, template_file: str, vars: tuple,
                 if vars_file.endswith('.json'):
                     file_vars = json.load(f)
                 else:
-                    import yaml
-                    file_vars = yaml.safe_load(f)
+                    file_vars = _load_yaml(f)
 
                 template_vars.update(file_vars)
 
         # Process template
+        from godaddy_cli.core.api_client import DNSRecord
         from godaddy_cli.core.template import TemplateProcessor
         processor = TemplateProcessor()
         processed_template = processor.process_template(template_data, template_vars)
@@ -185,8 +191,8 @@ def import_template(ctx, domain: str, template_file: str, vars: tuple,
         if dry_run:
             click.echo(format_status_panel('success', f'Template validation passed'))
             # Show generated records
-            for record in records[:5]:  # Show first 5 records
-                click.echo(f"  {record.name} {record.type} {record.data}")
+            # Show first 5 records
+            click.echo("\n".join(f"  {record.name} {record.type} {record.data}" for record in records[:5]))
             if len(records) > 5:
                 click.echo(f"  ... and {len(records) - 5} more records")
             return
@@ -198,11 +204,11 @@ def import_template(ctx, domain: str, template_file: str, vars: tuple,
                 return
 
         # Perform import
+        from godaddy_cli.core.api_client import SyncGoDaddyAPIClient
         client = SyncGoDaddyAPIClient(ctx.obj['auth'])
 
         with click.progressbar(length=len(records), label='Importing template') as bar:
-            results = client.bulk_update_records(domain, records, batch_size=10)
-            bar.update(len(records))
+            results = client.bulk_update_records(domain, records, batch_size=10, on_progress=bar.update)
 
         # Display results
         click.echo(format_bulk_operation_summary(results))
@@ -221,12 +227,47 @@ def import_template(ctx, domain: str, template_file: str, vars: tuple,
         ctx.exit(1)
 
 
-def _parse_records(content: str, input_format: str) -> List[DNSRecord]:
-    """Parse records from various formats"""
+def _load_yaml(stream: TextIO) -> Any:
+    """Safely parse YAML, importing PyYAML on first use and preferring libyaml's C parser"""
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+def _validate_one(record: 'DNSRecord', strict: bool = True) -> Optional[str]:
+    """Validate a single record, returning the error message instead of raising"""
+    try:
+        if strict:
+            record.full_validate()
+        else:
+            record.quick_validate()
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def _validate_records(records: List['DNSRecord'], strict: bool = True) -> List[str]:
+    """Validate records, spreading large strict runs across worker processes"""
+    if strict and len(records) > PARALLEL_VALIDATION_THRESHOLD:
+        from concurrent.futures import ProcessPoolExecutor
+        from functools import partial
+
+        with ProcessPoolExecutor() as executor:
+            errors = list(executor.map(partial(_validate_one, strict=True), records, chunksize=256))
+    else:
+        errors = [_validate_one(record, strict) for record in records]
+
+    return [f"Record {i}: {error}" for i, error in enumerate(errors, 1) if error]
+
+
+def _parse_records(stream: TextIO, input_format: str) -> List['DNSRecord']:
+    """Parse records from an open file in various formats"""
+    from godaddy_cli.core.api_client import DNSRecord
+
     records = []
 
     if input_format == 'json':
-        data = json.loads(content)
+        data = json.load(stream)
 
         # Handle different JSON structures
         if isinstance(data, list):
@@ -241,8 +282,7 @@ def _parse_records(content: str, input_format: str) -> List[DNSRecord]:
             records.append(record)
 
     elif input_format == 'yaml':
-        import yaml
-        data = yaml.safe_load(content)
+        data = _load_yaml(stream)
 
         # Handle different YAML structures
         if isinstance(data, list):
@@ -257,28 +297,12 @@ def _parse_records(content: str, input_format: str) -> List[DNSRecord]:
             records.append(record)
 
     elif input_format == 'csv':
-        csv_file = StringIO(content)
-        reader = csv.DictReader(csv_file)
-
-        for row in reader:
-            # Convert CSV row to record
-            record_data = {
-                'name': row.get('name', ''),
-                'type': row.get('type', ''),
-                'data': row.get('data', ''),
-                'ttl': int(row.get('ttl', 3600)) if row.get('ttl') else 3600
-            }
-
-            # Add optional fields
-            if row.get('priority'):
-                record_data['priority'] = int(row['priority'])
-            if row.get('weight'):
-                record_data['weight'] = int(row['weight'])
-            if row.get('port'):
-                record_data['port'] = int(row['port'])
-
-            record = DNSRecord.from_api_dict(record_data)
-            records.append(record)
+        # Positional rows plus one header lookup avoid building a dict per row
+        reader = csv.reader(stream)
+        header = next(reader, None)
+        if header:
+            columns = {name: i for i, name in enumerate(header)}
+            records.extend(DNSRecord.from_csv_row(row, columns) for row in reader if row)
 
     return records
 
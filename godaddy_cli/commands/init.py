@@ -13,6 +13,30 @@ from godaddy_cli.core.exceptions import ValidationError
 from godaddy_cli.utils.formatters import format_status_panel
 from godaddy_cli.utils.validators import validate_url
 
+# Static setup text, joined once so each section goes out in a single write
+QUICK_START_GUIDE = "\n".join([
+    "\n5. Quick Start Guide",
+    "=" * 20,
+    "Your GoDaddy DNS CLI is now ready! Try these commands:",
+    "",
+    "• List domains:        godaddy domains list",
+    "• List DNS records:    godaddy dns list example.com",
+    "• Add A record:        godaddy dns add example.com A www 192.168.1.1",
+    "• Start web UI:        godaddy web",
+    "• Show help:           godaddy --help",
+    ""
+])
+
+SECURITY_RECOMMENDATIONS = "\n".join([
+    "7. Security Recommendations",
+    "=" * 28,
+    "• Keep your API credentials secure",
+    "• Use OTE environment for testing",
+    "• Regularly rotate your API keys",
+    "• Enable audit logging for production use",
+    ""
+])
+
 
 @click.command('init')
 @click.option('--profile', default='default', help='Profile name to initialize')
@@ -27,8 +51,7 @@ def init_project(ctx, profile: str, api_key: Optional[str], api_secret: Optional
     """Initialize GoDaddy DNS CLI configuration"""
     try:
         # Welcome message
-        click.echo("🚀 GoDaddy DNS CLI Setup")
-        click.echo("=" * 50)
+        click.echo("🚀 GoDaddy DNS CLI Setup\n" + "=" * 50)
 
         # Check if already initialized
         config_manager = ConfigManager()
@@ -42,8 +65,8 @@ def init_project(ctx, profile: str, api_key: Optional[str], api_secret: Optional
             return
 
         # Interactive setup if credentials not provided
-        click.echo("\n1. API Credentials Setup")
-        click.echo("Get your API credentials from: https://developer.godaddy.com/keys")
+        click.echo("\n1. API Credentials Setup\n"
+                   "Get your API credentials from: https://developer.godaddy.com/keys")
 
         if not api_key:
             api_key = click.prompt("API Key", type=str)
@@ -58,9 +81,9 @@ def init_project(ctx, profile: str, api_key: Optional[str], api_secret: Optional
         # Determine API URL
         api_url = 'https://api.godaddy.com' if environment == 'production' else 'https://api.ote-godaddy.com'
 
-        click.echo(f"\n2. Environment Configuration")
-        click.echo(f"Environment: {environment}")
-        click.echo(f"API URL: {api_url}")
+        click.echo(f"\n2. Environment Configuration\n"
+                   f"Environment: {environment}\n"
+                   f"API URL: {api_url}")
 
         # Create profile
         if existing_profile:
@@ -99,33 +122,20 @@ def init_project(ctx, profile: str, api_key: Optional[str], api_secret: Optional
                 click.echo(format_status_panel('warning', 'API connection test failed. Please verify your credentials.'))
 
         # Quick start guide
-        click.echo("\n5. Quick Start Guide")
-        click.echo("=" * 20)
-        click.echo("Your GoDaddy DNS CLI is now ready! Try these commands:")
-        click.echo("")
-        click.echo("• List domains:        godaddy domains list")
-        click.echo("• List DNS records:    godaddy dns list example.com")
-        click.echo("• Add A record:        godaddy dns add example.com A www 192.168.1.1")
-        click.echo("• Start web UI:        godaddy web")
-        click.echo("• Show help:           godaddy --help")
-        click.echo("")
+        click.echo(QUICK_START_GUIDE)
 
         # Configuration summary
-        click.echo("6. Configuration Summary")
-        click.echo("=" * 25)
-        click.echo(f"Profile: {profile}")
-        click.echo(f"Environment: {environment}")
-        click.echo(f"Config location: {config_manager.config_file}")
-        click.echo("")
+        click.echo("\n".join([
+            "6. Configuration Summary",
+            "=" * 25,
+            f"Profile: {profile}",
+            f"Environment: {environment}",
+            f"Config location: {config_manager.config_file}",
+            ""
+        ]))
 
         # Security recommendations
-        click.echo("7. Security Recommendations")
-        click.echo("=" * 28)
-        click.echo("• Keep your API credentials secure")
-        click.echo("• Use OTE environment for testing")
-        click.echo("• Regularly rotate your API keys")
-        click.echo("• Enable audit logging for production use")
-        click.echo("")
+        click.echo(SECURITY_RECOMMENDATIONS)
 
         click.echo("🎉 Setup complete! Happy DNS managing!")
 
@@ -3,12 +3,38 @@ DNS monitoring commands
 """
 
 import click
+import collections
+import functools
+import json
+import operator
+import queue
+import sys
+import threading
 import time
 import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, List
-from datetime import datetime, timedelta
-
-from godaddy_cli.core.api_client import SyncGoDaddyAPIClient
+from datetime import datetime
+
+try:
+    import orjson
+except ImportError:  # optional C-accelerated encoder
+    orjson = None
+
+try:
+    import dns.exception
+    import dns.resolver
+except ImportError:  # only propagation checks need dnspython
+    dns = None
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:  # only webhook alerts need requests
+    requests = None
+
+from godaddy_cli.core.api_client import GoDaddyAPIClient
 from godaddy_cli.core.exceptions import APIError, ValidationError
 from godaddy_cli.utils.formatters import format_status_panel, format_monitoring_status
 from godaddy_cli.utils.validators import validate_domain, validate_url
@@ -23,16 +49,21 @@ def monitor_group(ctx):
 
 @monitor_group.command('start')
 @click.argument('domain')
+@click.option('--domains', 'extra_domains', multiple=True, help='Additional domains to monitor concurrently')
 @click.option('--interval', type=int, default=300, help='Check interval in seconds')
 @click.option('--timeout', type=int, default=3600, help='Monitor timeout in seconds')
 @click.option('--records', multiple=True, help='Specific records to monitor')
 @click.option('--alert-webhook', help='Webhook URL for alerts')
+@click.option('--adaptive', is_flag=True,
+              help='Back off the interval while nothing changes (up to 8x)')
 @click.pass_context
-def start_monitoring(ctx, domain: str, interval: int, timeout: int,
-                     records: tuple, alert_webhook: Optional[str]):
+def start_monitoring(ctx, domain: str, extra_domains: tuple, interval: int, timeout: int,
+                     records: tuple, alert_webhook: Optional[str], adaptive: bool):
     """Start monitoring DNS records for changes"""
     try:
-        validate_domain(domain)
+        domains = list(dict.fromkeys((domain,) + extra_domains))
+        for name in domains:
+            validate_domain(name)
 
         if alert_webhook:
             validate_url(alert_webhook)
@@ -40,126 +71,24 @@ def start_monitoring(ctx, domain: str, interval: int, timeout: int,
         if interval < 60:
             raise ValidationError("Minimum interval is 60 seconds")
 
-        client = SyncGoDaddyAPIClient(ctx.obj['auth'])
-
-        # Get initial state
-        click.echo(f"Starting DNS monitoring for {domain}")
-        click.echo(f"Check interval: {interval} seconds")
-        click.echo(f"Timeout: {timeout} seconds")
-
-        if records:
-            click.echo(f"Monitoring specific records: {', '.join(records)}")
-
-        initial_records = client.list_dns_records(domain)
-        if not initial_records:
-            click.echo(format_status_panel('warning', f'No DNS records found for {domain}'))
-            return
-
-        # Filter records if specified
-        if records:
-            initial_records = [r for r in initial_records if r.name in records]
-
-        click.echo(f"Monitoring {len(initial_records)} DNS records")
-
-        # Store initial state
-        initial_state = {
-            f"{r.name}.{r.type}": {
-                'data': r.data,
-                'ttl': r.ttl,
-                'priority': r.priority
-            }
-            for r in initial_records
-        }
+        # Checks per domain, kept outside the loops so an interrupt can still report them
+        check_counts = {}
 
-        start_time = datetime.now()
-        check_count = 0
+        async def monitor_all():
+            async with GoDaddyAPIClient(ctx.obj['auth']) as client:
+                await asyncio.gather(*[
+                    _monitor_loop(client, name, interval, timeout, records, alert_webhook,
+                                  check_counts, label=f"{name} " if len(domains) > 1 else "",
+                                  adaptive=adaptive)
+                    for name in domains
+                ])
 
         try:
-            while True:
-                # Check if timeout exceeded
-                if datetime.now() - start_time > timedelta(seconds=timeout):
-                    click.echo(format_status_panel('info', 'Monitoring timeout reached'))
-                    break
-
-                check_count += 1
-                check_time = datetime.now().strftime("%H:%M:%S")
-
-                try:
-                    # Get current records
-                    current_records = client.list_dns_records(domain)
-
-                    if records:
-                        current_records = [r for r in current_records if r.name in records]
-
-                    # Compare with initial state
-                    changes_detected = []
-
-                    for record in current_records:
-                        key = f"{record.name}.{record.type}"
-                        current_state = {
-                            'data': record.data,
-                            'ttl': record.ttl,
-                            'priority': record.priority
-                        }
-
-                        if key in initial_state:
-                            if initial_state[key] != current_state:
-                                changes_detected.append({
-                                    'record': key,
-                                    'old': initial_state[key],
-                                    'new': current_state
-                                })
-                                # Update initial state
-                                initial_state[key] = current_state
-                        else:
-                            # New record
-                            changes_detected.append({
-                                'record': key,
-                                'old': None,
-                                'new': current_state
-                            })
-                            initial_state[key] = current_state
-
-                    # Check for deleted records
-                    current_keys = {f"{r.name}.{r.type}" for r in current_records}
-                    for key in list(initial_state.keys()):
-                        if key not in current_keys:
-                            changes_detected.append({
-                                'record': key,
-                                'old': initial_state[key],
-                                'new': None
-                            })
-                            del initial_state[key]
-
-                    # Report status
-                    if changes_detected:
-                        click.echo(f"\n[{check_time}] CHANGES DETECTED:")
-                        for change in changes_detected:
-                            if change['old'] is None:
-                                click.echo(f"  + Added: {change['record']}")
-                            elif change['new'] is None:
-                                click.echo(f"  - Deleted: {change['record']}")
-                            else:
-                                click.echo(f"  ~ Modified: {change['record']}")
-                                for field, value in change['new'].items():
-                                    if change['old'][field] != value:
-                                        click.echo(f"    {field}: {change['old'][field]} → {value}")
-
-                        # Send webhook alert if configured
-                        if alert_webhook:
-                            _send_webhook_alert(alert_webhook, domain, changes_detected)
-
-                    else:
-                        click.echo(f"[{check_time}] Check #{check_count}: No changes detected")
-
-                except APIError as e:
-                    click.echo(f"[{check_time}] API Error: {e.message}", err=True)
-
-                # Wait for next check
-                time.sleep(interval)
-
+            asyncio.run(monitor_all())
+            # Let alerts still queued go out before the process exits
+            _alert_queue.join()
         except KeyboardInterrupt:
-            click.echo(f"\nMonitoring stopped by user after {check_count} checks")
+            click.echo(f"\nMonitoring stopped by user after {sum(check_counts.values())} checks")
 
     except ValidationError as e:
         click.echo(format_status_panel('error', f'Validation Error: {str(e)}'), err=True)
@@ -172,6 +101,150 @@ def start_monitoring(ctx, domain: str, interval: int, timeout: int,
         ctx.exit(1)
 
 
+async def _monitor_loop(client: GoDaddyAPIClient, domain: str, interval: int, timeout: int,
+                        records: tuple, alert_webhook: Optional[str], check_counts: dict,
+                        label: str = "", adaptive: bool = False) -> None:
+    """Poll one domain for record changes until the timeout, sleeping without blocking other domains"""
+    # Get initial state
+    banner = [
+        f"Starting DNS monitoring for {domain}",
+        f"Check interval: {interval} seconds",
+        f"Timeout: {timeout} seconds"
+    ]
+    if records:
+        banner.append(f"Monitoring specific records: {', '.join(records)}")
+    click.echo("\n".join(banner))
+
+    initial_records = await client.list_dns_records(domain)
+    if not initial_records:
+        click.echo(format_status_panel('warning', f'No DNS records found for {domain}'))
+        return
+
+    # Filter records if specified; a set keeps each membership test O(1)
+    records_set = frozenset(records)
+    if records_set:
+        initial_records = [r for r in initial_records if r.name in records_set]
+
+    click.echo(f"Monitoring {len(initial_records)} DNS records")
+
+    # Store initial state as State tuples. Keys are interned, so every later
+    # lookup of the same record resolves to the stored key object and the
+    # dict compares keys by identity instead of by content
+    initial_state = {
+        sys.intern(name + '.' + rtype): State(data, ttl, priority)
+        for name, rtype, data, ttl, priority in map(_record_fields, initial_records)
+    }
+
+    # The monotonic clock is cheap to read and immune to wall-clock jumps
+    deadline = time.monotonic() + timeout
+    check_counts[domain] = 0
+    current_interval = interval
+
+    # On a terminal, quiet checks rewrite one status line instead of scrolling;
+    # piped output keeps a line per check for the log
+    in_place = click.get_text_stream('stdout').isatty()
+    status_line_open = False
+
+    while True:
+        # Check if timeout exceeded
+        if time.monotonic() >= deadline:
+            if status_line_open:
+                click.echo()
+            click.echo(format_status_panel('info', f'{label}Monitoring timeout reached'))
+            break
+
+        check_counts[domain] += 1
+        check_count = check_counts[domain]
+        check_time = time.strftime('%H:%M:%S')
+
+        try:
+            # Get current records
+            current_records = await client.list_dns_records(domain)
+
+            # Filter and compare with initial state in a single pass
+            changes_detected = []
+            seen = set()
+
+            for name, rtype, data, ttl, priority in map(_record_fields, current_records):
+                if records_set and name not in records_set:
+                    continue
+                key = sys.intern(name + '.' + rtype)
+                seen.add(key)
+                current_state = State(data, ttl, priority)
+                previous_state = initial_state.get(key)
+
+                # Tuples compare without allocating; dicts are only built for webhooks
+                if previous_state is None:
+                    # New record
+                    changes_detected.append({
+                        'record': key,
+                        'old': None,
+                        'new': current_state
+                    })
+                    initial_state[key] = current_state
+                elif previous_state != current_state:
+                    changes_detected.append({
+                        'record': key,
+                        'old': previous_state,
+                        'new': current_state
+                    })
+                    # Update initial state
+                    initial_state[key] = current_state
+
+            # Check for deleted records; the keys view difference runs as one C-level set op
+            for key in sorted(initial_state.keys() - seen):
+                changes_detected.append({
+                    'record': key,
+                    'old': initial_state.pop(key),
+                    'new': None
+                })
+
+            # Report status; the whole report goes out in a single write
+            if changes_detected:
+                lines = [f"\n[{check_time}] {label}CHANGES DETECTED:"]
+                for change in changes_detected:
+                    if change['old'] is None:
+                        lines.append(f"  + Added: {change['record']}")
+                    elif change['new'] is None:
+                        lines.append(f"  - Deleted: {change['record']}")
+                    else:
+                        lines.append(f"  ~ Modified: {change['record']}")
+                        for field, old_value, new_value in zip(State._fields, change['old'], change['new']):
+                            if old_value != new_value:
+                                lines.append(f"    {field}: {old_value} → {new_value}")
+                # The report opens with a newline, which also ends any status line
+                click.echo("\n".join(lines))
+                status_line_open = False
+
+                # Hand the alert to the background sender so a slow webhook never delays polling
+                if alert_webhook and not _queue_webhook_alert(alert_webhook, domain,
+                                                              _alert_changes(changes_detected)):
+                    click.echo(f"[{check_time}] {label}Alert queue full, webhook alert dropped", err=True)
+
+            elif in_place:
+                click.echo(f"\r[{check_time}] {label}Check #{check_count}: No changes detected", nl=False)
+                status_line_open = True
+            else:
+                click.echo(f"[{check_time}] {label}Check #{check_count}: No changes detected")
+
+            if adaptive:
+                # Poll less often while the zone is quiet; any change restores the base interval
+                if changes_detected:
+                    current_interval = interval
+                else:
+                    current_interval = min(current_interval * 2, interval * MAX_BACKOFF_FACTOR)
+
+        except APIError as e:
+            if status_line_open:
+                click.echo()
+                status_line_open = False
+            click.echo(f"[{check_time}] {label}API Error: {e.message}", err=True)
+
+        # Wait for next check, stretched by the API's rate-limit headers but never past the deadline
+        delay = _rate_limited_delay(current_interval, client.rate_limit_info)
+        await asyncio.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+
+
 @monitor_group.command('check')
 @click.argument('record')
 @click.option('--timeout', type=int, default=300, help='Propagation check timeout')
@@ -179,6 +252,11 @@ def start_monitoring(ctx, domain: str, interval: int, timeout: int,
 @click.pass_context
 def check_propagation(ctx, record: str, timeout: int, dns_servers: Optional[str]):
     """Check DNS record propagation across servers"""
+    if dns is None:
+        click.echo(format_status_panel('error', 'dnspython library required for propagation checks'), err=True)
+        click.echo("Install with: pip install dnspython")
+        ctx.exit(1)
+
     try:
         # Default DNS servers
         default_servers = ['8.8.8.8', '1.1.1.1', '208.67.222.222', '9.9.9.9']
@@ -192,67 +270,108 @@ def check_propagation(ctx, record: str, timeout: int, dns_servers: Optional[str]
         click.echo(f"DNS servers: {', '.join(servers)}")
         click.echo(f"Timeout: {timeout} seconds")
 
-        import dns.resolver
-        import dns.exception
-
-        start_time = datetime.now()
+        start_time = time.monotonic()
         results = {}
 
-        while True:
-            all_consistent = True
-            expected_value = None
-
-            for server in servers:
-                try:
-                    resolver = dns.resolver.Resolver()
-                    resolver.nameservers = [server]
-                    resolver.timeout = 5
-
-                    # Try different record types
-                    for record_type in ['A', 'AAAA', 'CNAME', 'MX', 'TXT']:
-                        try:
-                            answer = resolver.resolve(record, record_type)
-                            values = [str(rdata) for rdata in answer]
-
-                            if expected_value is None:
-                                expected_value = values
-                            elif values != expected_value:
-                                all_consistent = False
+        # One resolver per server, reused on every pass
+        resolvers = {}
+        for server in servers:
+            try:
+                # configure=False skips parsing the system resolv.conf, whose
+                # nameservers would be replaced anyway
+                resolver = dns.resolver.Resolver(configure=False)
+                resolver.nameservers = [server]
+                resolver.timeout = 5
+                resolver.lifetime = 5
+                resolvers[server] = resolver
+            except Exception as e:
+                results[server] = f"Error: {str(e)}"
+
+        # Record type that last answered on each server; later passes ask for it
+        # alone and only probe the other types again if it stops answering
+        winning_type = {}
+        # First type any server answered for the record. A name usually has a
+        # single type, so servers without a winner of their own try it first
+        detected_type = None
+
+        # Pause between passes: starts short to catch quick propagation, then
+        # grows so slow propagation doesn't hammer the public resolvers
+        delay = 1.0
+
+        # The lookups of a pass run concurrently, so a pass takes as long as
+        # its slowest lookup rather than their sum
+        with ThreadPoolExecutor(max_workers=max(len(resolvers) * len(PROPAGATION_TYPES), 1)) as executor:
+
+            def resolve_all(tasks):
+                futures = {
+                    executor.submit(_resolve_values, resolvers[server], record, record_type): (server, record_type)
+                    for server, record_type in tasks
+                }
+                return {futures[future]: future.result() for future in as_completed(futures)}
 
-                            results[f"{server}_{record_type}"] = values
-                            break
-                        except dns.exception.DNSException:
+            while True:
+                all_consistent = len(resolvers) == len(servers)
+                expected_value = None
+
+                preferred = {server: winning_type.get(server, detected_type) for server in resolvers}
+
+                answers = resolve_all(
+                    [(server, record_type) for server, record_type in preferred.items() if record_type]
+                    + [(server, record_type) for server, preferred_type in preferred.items()
+                       if preferred_type is None for record_type in PROPAGATION_TYPES]
+                )
+                answers.update(resolve_all([
+                    (server, record_type)
+                    for server, preferred_type in preferred.items()
+                    if preferred_type and isinstance(answers[(server, preferred_type)], dns.exception.DNSException)
+                    for record_type in PROPAGATION_TYPES if record_type != preferred_type
+                ]))
+
+                for server in resolvers:
+                    # First record type in probe order that answered wins
+                    for record_type in _probe_order(preferred[server]):
+                        values = answers[(server, record_type)]
+                        if isinstance(values, dns.exception.DNSException):
                             continue
+                        if isinstance(values, Exception):
+                            results[server] = f"Error: {str(values)}"
+                            all_consistent = False
+                            break
 
-                except Exception as e:
-                    results[server] = f"Error: {str(e)}"
-                    all_consistent = False
-
-            # Display current status
-            elapsed = (datetime.now() - start_time).total_seconds()
-            click.echo(f"\n[{elapsed:.0f}s] Propagation check:")
-
-            for server in servers:
-                server_results = [v for k, v in results.items() if k.startswith(server)]
-                if server_results:
-                    click.echo(f"  {server}: {server_results[0]}")
-                else:
-                    click.echo(f"  {server}: No response")
+                        if expected_value is None:
+                            expected_value = values
+                        elif values != expected_value:
+                            all_consistent = False
+
+                        results[f"{server}_{record_type}"] = values
+                        winning_type[server] = record_type
+                        if detected_type is None:
+                            detected_type = record_type
+                        break
+
+                # Display current status
+                elapsed = time.monotonic() - start_time
+                click.echo(f"\n[{elapsed:.0f}s] Propagation check:")
+
+                for server in servers:
+                    server_results = [v for k, v in results.items() if k.startswith(server)]
+                    if server_results:
+                        click.echo(f"  {server}: {server_results[0]}")
+                    else:
+                        click.echo(f"  {server}: No response")
 
-            if all_consistent and expected_value:
-                click.echo(format_status_panel('success', 'DNS propagation complete'))
-                break
+                if all_consistent and expected_value:
+                    click.echo(format_status_panel('success', 'DNS propagation complete'))
+                    break
 
-            if elapsed >= timeout:
-                click.echo(format_status_panel('warning', 'Propagation check timeout reached'))
-                break
+                if elapsed >= timeout:
+                    click.echo(format_status_panel('warning', 'Propagation check timeout reached'))
+                    break
 
-            time.sleep(10)
+                # Never sleep past the timeout
+                time.sleep(min(delay, max(timeout - elapsed, 0)))
+                delay = min(delay * 1.5, 10.0)
 
-    except ImportError:
-        click.echo(format_status_panel('error', 'dnspython library required for propagation checks'), err=True)
-        click.echo("Install with: pip install dnspython")
-        ctx.exit(1)
     except Exception as e:
         click.echo(format_status_panel('error', f'Propagation check failed: {str(e)}'), err=True)
         ctx.exit(1)
@@ -332,11 +451,121 @@ def setup_alert(ctx, domain: str, webhook_url: str, test: bool):
         ctx.exit(1)
 
 
+# Snapshot of the monitored fields of one record
+State = collections.namedtuple('State', 'data ttl priority')
+
+# Largest multiple of the base interval that --adaptive backs off to
+MAX_BACKOFF_FACTOR = 8
+
+# Fetches a record's key and state fields in one call
+_record_fields = operator.attrgetter('name', 'type', *State._fields)
+
+# Below this many remaining API requests, the wait between checks doubles
+RATE_LIMIT_LOW_WATER = 5
+
+# Webhook alerts waiting for the background sender
+_alert_queue: queue.Queue = queue.Queue(maxsize=1024)
+
+# Record types tried, in order, when checking propagation
+PROPAGATION_TYPES = ('A', 'AAAA', 'CNAME', 'MX', 'TXT')
+
+
+def _alert_changes(changes: List[dict]) -> List[dict]:
+    """Expand the State snapshots in detected changes into plain dicts for the webhook payload"""
+    return [
+        {
+            'record': change['record'],
+            'old': change['old'] and change['old']._asdict(),
+            'new': change['new'] and change['new']._asdict()
+        }
+        for change in changes
+    ]
+
+
+def _rate_limited_delay(interval: float, rate_limit_info: dict) -> float:
+    """Stretch the wait before the next check to honour Retry-After and a low remaining budget"""
+    delay = max(interval, rate_limit_info.get('retry_after') or 0)
+    remaining = rate_limit_info.get('remaining')
+    if remaining is not None and remaining < RATE_LIMIT_LOW_WATER:
+        delay *= 2
+    return delay
+
+
+def _probe_order(winner: Optional[str]) -> tuple:
+    """Record types to try on a server, with the preferred one first"""
+    if winner is None:
+        return PROPAGATION_TYPES
+    return (winner,) + tuple(t for t in PROPAGATION_TYPES if t != winner)
+
+
+def _resolve_values(resolver, record: str, record_type: str):
+    """Resolve one record type, returning the answer values or the exception raised"""
+    try:
+        return [str(rdata) for rdata in resolver.resolve(record, record_type)]
+    except Exception as e:
+        return e
+
+
+@functools.lru_cache(maxsize=None)
+def _webhook_session():
+    """Build the shared webhook session on first use, so alerts reuse pooled connections"""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'GoDaddy-DNS-CLI/2.0.0',
+        'Content-Type': 'application/json'
+    })
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                          max_retries=Retry(total=2, backoff_factor=0.2))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _alert_worker():
+    """Send queued webhook alerts one after another for the life of the process"""
+    while True:
+        webhook_url, domain, changes = _alert_queue.get()
+        try:
+            _send_webhook_alert(webhook_url, domain, changes)
+        finally:
+            _alert_queue.task_done()
+
+
+@functools.lru_cache(maxsize=None)
+def _start_alert_worker() -> threading.Thread:
+    """Start the daemon thread draining the alert queue on first use"""
+    worker = threading.Thread(target=_alert_worker, name='webhook-alerts', daemon=True)
+    worker.start()
+    return worker
+
+
+def _queue_webhook_alert(webhook_url: str, domain: str, changes: List[dict]) -> bool:
+    """Queue a webhook alert for the background sender, returning False if the queue is full"""
+    _start_alert_worker()
+    try:
+        _alert_queue.put_nowait((webhook_url, domain, changes))
+    except queue.Full:
+        return False
+    return True
+
+
+def _encode_payload(payload: dict) -> bytes:
+    """Serialize a webhook payload to compact JSON, using orjson when installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except TypeError:
+            # Values orjson rejects (e.g. integers beyond 64 bits) fall back to stdlib json
+            pass
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
 def _send_webhook_alert(webhook_url: str, domain: str, changes: List[dict], test: bool = False) -> bool:
     """Send webhook alert for DNS changes"""
-    try:
-        import requests
+    if requests is None:
+        return False
 
+    try:
         payload = {
             'domain': domain,
             'timestamp': datetime.now().isoformat(),
@@ -347,12 +576,8 @@ def _send_webhook_alert(webhook_url: str, domain: str, changes: List[dict], test
         if test:
             payload['message'] = 'Test alert from GoDaddy DNS CLI'
 
-        response = requests.post(
-            webhook_url,
-            json=payload,
-            timeout=10,
-            headers={'User-Agent': 'GoDaddy-DNS-CLI/2.0.0'}
-        )
+        # Posting pre-encoded bytes skips requests' own json.dumps pass
+        response = _webhook_session().post(webhook_url, data=_encode_payload(payload), timeout=10)
 
         return response.status_code < 400
 
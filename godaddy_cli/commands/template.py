@@ -4,22 +4,42 @@ DNS configuration templates for automation and standardization
 """
 
 import click
+import functools
+import itertools
 import json
+import os
+import time
 import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from jinja2 import Template, Environment, FileSystemLoader
-from jsonschema import validate, ValidationError
+from jinja2 import Template, Environment, FileSystemLoader, FileSystemBytecodeCache, FunctionLoader
+from jsonschema import Draft7Validator, ValidationError
+
+try:
+    import fastjsonschema
+except ImportError:  # optional compiled validator
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:  # optional C-accelerated parser
+    orjson = None
 
 from godaddy_cli.core.api_client import SyncGoDaddyAPIClient, DNSRecord
 from godaddy_cli.core.config import ConfigManager
+from godaddy_cli.utils.formatters import format_json_output
 from godaddy_cli.utils.validators import validate_domain
 
 console = Console()
 
+# libyaml's C loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 TEMPLATE_SCHEMA = {
     "type": "object",
     "properties": {
@@ -52,6 +72,17 @@ TEMPLATE_SCHEMA = {
     "required": ["name", "records"]
 }
 
+# Shared by every render. Record fields are loaded by their own source text,
+# so the environment's template cache and, once enabled, the on-disk bytecode
+# cache both apply; Environment.from_string uses neither
+_JINJA_ENV = Environment(loader=FunctionLoader(lambda source: source), autoescape=False, cache_size=512)
+
+# Built once; jsonschema.validate() re-checks the schema and picks a draft on every call
+_TEMPLATE_VALIDATOR = Draft7Validator(TEMPLATE_SCHEMA)
+
+# fastjsonschema turns the schema into plain Python code, which checks far faster still
+_COMPILED_TEMPLATE_SCHEMA = fastjsonschema.compile(TEMPLATE_SCHEMA) if fastjsonschema is not None else None
+
 @click.group()
 @click.pass_context
 def template(ctx):
@@ -73,28 +104,25 @@ def list(ctx, output_format):
         console.print("[yellow]No templates directory found[/yellow]")
         return
 
+    with os.scandir(templates_dir) as entries:
+        template_files = [entry for entry in entries
+                          if entry.name.endswith('.yaml') and entry.is_file()]
+
     templates = []
-    for template_file in templates_dir.glob('*.yaml'):
-        try:
-            with open(template_file, 'r') as f:
-                template_data = yaml.safe_load(f)
-                templates.append({
-                    'file': template_file.name,
-                    'name': template_data.get('name', 'Unknown'),
-                    'description': template_data.get('description', ''),
-                    'version': template_data.get('version', '1.0.0')
-                })
-        except Exception:
-            continue
+    if template_files:
+        # Reading and parsing are independent per file, so overlap them
+        with ThreadPoolExecutor(max_workers=min(16, len(template_files))) as executor:
+            summaries = executor.map(_template_summary, template_files)
+            templates = [summary for summary in summaries if summary is not None]
 
     if not templates:
         console.print("[yellow]No templates found[/yellow]")
         return
 
     if output_format == 'json':
-        console.print(json.dumps(templates, indent=2))
+        console.print(format_json_output(templates))
     elif output_format == 'yaml':
-        console.print(yaml.dump(templates, default_flow_style=False))
+        console.print(yaml.dump(templates, Dumper=_YAML_DUMPER, default_flow_style=False))
     else:
         table = Table(title="DNS Templates", show_header=True)
         table.add_column("Name", style="cyan")
@@ -129,14 +157,12 @@ def show(ctx, name, vars, vars_file, dry_run):
         return
 
     try:
-        with open(template_path, 'r') as f:
-            template_data = yaml.safe_load(f)
-
-        # Validate template
-        validate(template_data, TEMPLATE_SCHEMA)
+        # Parsed and validated once per file version
+        template_data = _load_template(template_path)
 
         # Parse variables
         variables = _parse_variables(vars, vars_file)
+        _enable_bytecode_cache(config)
 
         # Show template info
         info_table = Table(title="Template Information", show_header=True)
@@ -220,14 +246,12 @@ def apply(ctx, domain, template_name, vars, vars_file, dry_run, backup, merge):
         return
 
     try:
-        with open(template_path, 'r') as f:
-            template_data = yaml.safe_load(f)
-
-        # Validate template
-        validate(template_data, TEMPLATE_SCHEMA)
+        # Parsed and validated once per file version
+        template_data = _load_template(template_path)
 
         # Parse variables
         variables = _parse_variables(vars, vars_file)
+        _enable_bytecode_cache(config)
         variables['domain'] = domain  # Add domain as implicit variable
 
         # Generate records
@@ -262,35 +286,30 @@ def apply(ctx, domain, template_name, vars, vars_file, dry_run, backup, merge):
 
         # Create backup
         if backup and existing_records:
+            # Records go to the encoder as dataclasses; orjson serializes them natively
             backup_data = {
                 'domain': domain,
                 'template': template_name,
                 'timestamp': time.time(),
-                'records': [r.__dict__ for r in existing_records]
+                'records': existing_records
             }
-            with open(backup, 'w') as f:
-                json.dump(backup_data, f, indent=2)
+            Path(backup).write_text(format_json_output(backup_data))
             console.print(f"[green]Backup created at {backup}[/green]")
 
         # Apply records
         if merge:
-            # Merge with existing records
-            all_records = existing_records + records
-            # Remove duplicates (keep template records)
-            unique_records = {}
-            for record in all_records:
-                key = f"{record.name}:{record.type}"
-                unique_records[key] = record
-            final_records = list(unique_records.values())
+            # Merge with existing records in one pass; template records come
+            # last, so they replace existing ones with the same name and type.
+            # (The builtin list is shadowed by the `list` command here.)
+            final_records = [*{
+                (record.name, record.type): record
+                for record in itertools.chain(existing_records, records)
+            }.values()]
         else:
             final_records = records
 
         # Apply to domain
-        success = client._run_async(
-            client._execute_with_client(
-                lambda c: c.replace_all_records(domain, final_records)
-            )
-        )
+        success = client.replace_all_records(domain, final_records)
 
         if success:
             console.print(f"[green]Template applied successfully to {domain}[/green]")
@@ -417,7 +436,7 @@ def create(ctx, name, description, from_domain, interactive):
     # Save template
     try:
         with open(template_file, 'w') as f:
-            yaml.dump(template_data, f, default_flow_style=False, indent=2)
+            yaml.dump(template_data, f, Dumper=_YAML_DUMPER, default_flow_style=False, indent=2)
 
         console.print(f"[green]Template '{name}' created at {template_file}[/green]")
 
@@ -444,6 +463,75 @@ def delete(ctx, name):
         except Exception as e:
             console.print(f"[red]Error deleting template: {e}[/red]")
 
+def _validate_template(template_data: Any) -> None:
+    """Validate a template against TEMPLATE_SCHEMA, raising jsonschema's ValidationError"""
+    if _COMPILED_TEMPLATE_SCHEMA is None:
+        _TEMPLATE_VALIDATOR.validate(template_data)
+        return
+
+    try:
+        _COMPILED_TEMPLATE_SCHEMA(template_data)
+    except fastjsonschema.JsonSchemaException as e:
+        raise ValidationError(e.message) from e
+
+def _load_template(template_path: Path) -> Dict[str, Any]:
+    """Load and validate a template, reusing the result while the file is unchanged
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    stat = template_path.stat()
+    return _load_validated_template(str(template_path), stat.st_mtime_ns, stat.st_size)
+
+@functools.lru_cache(maxsize=32)
+def _load_validated_template(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse and validate a template file; the stat fields only key the cache"""
+    with open(path, 'r') as f:
+        template_data = yaml.load(f, Loader=_YAML_LOADER)
+    _validate_template(template_data)
+    return template_data
+
+def _template_summary(entry: os.DirEntry) -> Optional[Dict[str, str]]:
+    """Summarize one template file for `list`, or None if it can't be read"""
+    try:
+        template_data = _load_template_header(entry.path)
+        return {
+            'file': entry.name,
+            'name': template_data.get('name', 'Unknown'),
+            'description': template_data.get('description', ''),
+            'version': template_data.get('version', '1.0.0')
+        }
+    except Exception:
+        return None
+
+def _load_template_header(path: str) -> Dict[str, Any]:
+    """Parse a template's top-level fields without its records block
+
+    The records are skipped line by line instead of being parsed, since
+    they are nearly all of a large template. Files the shortcut can't
+    handle are parsed in full.
+    """
+    header = []
+    in_records = False
+    with open(path, 'r') as f:
+        for line in f:
+            if line.startswith('records:'):
+                in_records = True
+            elif in_records and line[:1] not in (' ', '\t', '-', '#', '\n', '\r'):
+                # Next top-level key ends the block
+                in_records = False
+            if not in_records:
+                header.append(line)
+
+    try:
+        template_data = yaml.load(''.join(header), Loader=_YAML_LOADER)
+    except yaml.YAMLError:
+        template_data = None
+
+    if not isinstance(template_data, dict) or 'name' not in template_data:
+        with open(path, 'r') as f:
+            template_data = yaml.load(f, Loader=_YAML_LOADER)
+    return template_data
+
 def _find_template(config: ConfigManager, name: str) -> Optional[Path]:
     """Find template file by name"""
     templates_dir = config.config_dir / 'templates'
@@ -466,11 +554,15 @@ def _parse_variables(vars_list: tuple, vars_file: Optional[str]) -> Dict[str, An
 
     # Load from file first
     if vars_file:
-        with open(vars_file, 'r') as f:
-            if vars_file.endswith('.json'):
-                variables.update(json.load(f))
-            else:
-                variables.update(yaml.safe_load(f) or {})
+        if vars_file.endswith('.json') and orjson is not None:
+            # orjson parses the raw bytes without a text-decoding pass
+            variables.update(orjson.loads(Path(vars_file).read_bytes()))
+        else:
+            with open(vars_file, 'r') as f:
+                if vars_file.endswith('.json'):
+                    variables.update(json.load(f))
+                else:
+                    variables.update(yaml.load(f, Loader=_YAML_LOADER) or {})
 
     # Override with command line variables
     for var in vars_list:
@@ -480,23 +572,39 @@ def _parse_variables(vars_list: tuple, vars_file: Optional[str]) -> Dict[str, An
 
     return variables
 
+def _enable_bytecode_cache(config: ConfigManager) -> None:
+    """Persist compiled record fields under the config cache so later runs skip compiling them"""
+    if _JINJA_ENV.bytecode_cache is not None:
+        return
+
+    cache_dir = config.config_dir / 'cache' / 'jinja'
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        # The cache is only an optimization; render without it
+        return
+    _JINJA_ENV.bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+
+def _render_field(source: str, variables: Dict[str, Any]) -> str:
+    """Render a record field, passing through fields without any Jinja markup"""
+    if '{' not in source:
+        return source
+    return _JINJA_ENV.get_template(source).render(variables)
+
 def _generate_records(template_data: Dict[str, Any], variables: Dict[str, Any]) -> List[DNSRecord]:
     """Generate DNS records from template and variables"""
-    env = Environment()
     records = []
 
-    # Add defaults for missing optional variables
-    if 'variables' in template_data:
-        defaults = template_data['variables'].get('defaults', {})
-        for key, value in defaults.items():
-            if key not in variables:
-                variables[key] = value
+    # Defaults fill in missing optional variables; a new dict leaves the caller's untouched
+    defaults = (template_data.get('variables') or {}).get('defaults') or {}
+    variables = {**defaults, **variables}
 
-    for record_data in template_data.get('records', []):
+    for record_data in template_data.get('records') or ():
         try:
-            # Render template fields
-            name = env.from_string(record_data['name']).render(**variables)
-            data = env.from_string(record_data['data']).render(**variables)
+            # Render each field on its own, so {% set %} or loop state in one
+            # field never leaks into the next; compiled templates are cached
+            name = _render_field(record_data['name'], variables)
+            data = _render_field(record_data['data'], variables)
 
             record = DNSRecord(
                 name=name,
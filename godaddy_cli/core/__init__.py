@@ -2,6 +2,13 @@
 
 from godaddy_cli.core.config import ConfigManager
 from godaddy_cli.core.auth import AuthManager
-from godaddy_cli.core.api_client import GoDaddyAPIClient
 
-__all__ = ['ConfigManager', 'AuthManager', 'GoDaddyAPIClient']
\ No newline at end of file
+__all__ = ['ConfigManager', 'AuthManager', 'GoDaddyAPIClient']
+
+
+def __getattr__(name):
+    # The API client pulls in aiohttp; only import it when actually requested
+    if name == 'GoDaddyAPIClient':
+        from godaddy_cli.core.api_client import GoDaddyAPIClient
+        return GoDaddyAPIClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
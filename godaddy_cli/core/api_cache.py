@@ -0,0 +1,80 @@
+"""
+On-disk TTL cache for read-only GoDaddy API responses
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Upper bound, in seconds, on how long any cached response is reused
+MAX_TTL = 900
+
+
+class APICache:
+    """JSON file cache of API responses, scoped to one account and environment"""
+
+    def __init__(self, cache_dir: Path, account: str, ttl: int = MAX_TTL):
+        digest = hashlib.blake2b(account.encode('utf-8'), digest_size=16).hexdigest()
+        self.path = cache_dir / f'api-{digest}.json'
+        self.ttl = min(ttl, MAX_TTL)
+        self._entries: Optional[Dict[str, List[Any]]] = None
+        self._dirty = False
+        # Commands may share one cache across worker threads
+        self._lock = threading.RLock()
+
+    def _load(self) -> Dict[str, List[Any]]:
+        """Read the cache file once; a missing or corrupt file is an empty cache"""
+        with self._lock:
+            if self._entries is None:
+                try:
+                    with open(self.path, 'r') as f:
+                        self._entries = json.load(f)
+                except (OSError, ValueError):
+                    self._entries = {}
+            return self._entries
+
+    def save(self):
+        """Write pending changes atomically; caching is best-effort and never fails a command"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            now = time.time()
+            entries = {key: entry for key, entry in self._load().items() if entry[0] > now}
+            tmp_path = self.path.with_suffix('.tmp')
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with open(tmp_path, 'w') as f:
+                    json.dump(entries, f)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                pass
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None if absent or expired"""
+        entry = self._load().get(key)
+        if entry is None or entry[0] <= time.time():
+            return None
+        return entry[1]
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        """Store a JSON-serializable value for at most MAX_TTL seconds; written on save()"""
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        with self._lock:
+            self._load()[key] = [time.time() + ttl, value]
+            self._dirty = True
+
+    def invalidate(self, prefix: str):
+        """Drop every entry whose key starts with prefix, persisting at once"""
+        with self._lock:
+            entries = self._load()
+            stale = [key for key in entries if key.startswith(prefix)]
+            if stale:
+                for key in stale:
+                    del entries[key]
+                self._dirty = True
+                self.save()
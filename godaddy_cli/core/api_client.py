@@ -5,21 +5,42 @@ High-performance, rate-limited client for GoDaddy DNS API
 
 import asyncio
 import aiohttp
+import sys
 import time
-from typing import Dict, List, Optional, Any, Union, AsyncGenerator
+import warnings
+from typing import Dict, List, Optional, Any, Union, AsyncGenerator, Callable, Sequence, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
+from datetime import datetime, timezone
+from functools import cached_property, partial
 import json
 import logging
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from godaddy_cli.core.api_cache import APICache
 from godaddy_cli.core.auth import AuthManager, APICredentials
+from godaddy_cli.core import exceptions
+from godaddy_cli.core.exceptions import ValidationError
 from godaddy_cli.utils.error_handlers import UserFriendlyErrorHandler, create_error_context
+from godaddy_cli.utils.validators import (
+    validate_cname_data, validate_ip, validate_mx_data, validate_port, validate_priority,
+    validate_record_type, validate_srv_data, validate_ttl, validate_txt_data, validate_weight
+)
 
 console = Console()
 logger = logging.getLogger(__name__)
 
+# Record data checks by type; the validators' patterns are compiled once at import
+_DATA_VALIDATORS = {
+    'A': partial(validate_ip, version=4),
+    'AAAA': partial(validate_ip, version=6),
+    'CNAME': validate_cname_data,
+    'MX': validate_mx_data,
+    'TXT': validate_txt_data,
+    'SRV': validate_srv_data,
+}
+
 class RecordType(Enum):
     """DNS record types supported by GoDaddy"""
     A = "A"
@@ -32,7 +53,10 @@ class RecordType(Enum):
     PTR = "PTR"
     CAA = "CAA"
 
-@dataclass
+# Slotted dataclasses (Python 3.10+) keep per-record memory low for large zones
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class DNSRecord:
     """DNS record data structure"""
     name: str
@@ -67,6 +91,40 @@ class DNSRecord:
 
         return result
 
+    def quick_validate(self) -> bool:
+        """Constant-time structural checks: name and data present, known type, TTL in range"""
+        if not self.name:
+            raise ValidationError("Record name cannot be empty")
+        if not self.data:
+            raise ValidationError("Record data cannot be empty")
+        validate_record_type(self.type)
+        validate_ttl(self.ttl)
+        return True
+
+    def full_validate(self) -> bool:
+        """Structural checks plus type-specific data checks; raises ValidationError on the first problem"""
+        self.quick_validate()
+
+        record_type = self.type.upper()
+        data_validator = _DATA_VALIDATORS.get(record_type)
+        # '@' stands for the zone apex wherever a hostname is expected
+        if data_validator and self.data != '@':
+            data_validator(self.data)
+
+        if record_type in ('MX', 'SRV'):
+            if self.priority is None:
+                raise ValidationError(f"{record_type} records require a priority value")
+            validate_priority(self.priority)
+        if record_type == 'SRV':
+            if self.port is None:
+                raise ValidationError("SRV records require a port value")
+            validate_port(self.port)
+            validate_weight(self.weight or 0)
+
+        return True
+
+    validate = full_validate
+
     @classmethod
     def from_api_dict(cls, data: Dict[str, Any]) -> 'DNSRecord':
         """Create from GoDaddy API response"""
@@ -80,6 +138,30 @@ class DNSRecord:
             weight=data.get('weight')
         )
 
+    @classmethod
+    def from_csv_row(cls, row: Sequence[str], columns: Dict[str, int]) -> 'DNSRecord':
+        """Create from a csv.reader row; columns maps header names to positions and blanks mean unset"""
+        ttl = _csv_field(row, columns, 'ttl')
+        priority = _csv_field(row, columns, 'priority')
+        port = _csv_field(row, columns, 'port')
+        weight = _csv_field(row, columns, 'weight')
+        return cls(
+            name=_csv_field(row, columns, 'name'),
+            type=_csv_field(row, columns, 'type'),
+            data=_csv_field(row, columns, 'data'),
+            ttl=int(ttl) if ttl else 3600,
+            priority=int(priority) if priority else None,
+            port=int(port) if port else None,
+            weight=int(weight) if weight else None
+        )
+
+def _csv_field(row: Sequence[str], columns: Dict[str, int], name: str) -> str:
+    """Value of a named CSV column, or '' when the column or the cell is missing"""
+    index = columns.get(name)
+    if index is None or index >= len(row):
+        return ''
+    return row[index]
+
 @dataclass
 class Domain:
     """Domain information"""
@@ -91,6 +173,19 @@ class Domain:
     privacy: bool = False
     locked: bool = False
 
+    @cached_property
+    def expires_ts(self) -> Optional[float]:
+        """Expiry as a POSIX timestamp, parsed once; None if missing or unparseable"""
+        if not self.expires:
+            return None
+        try:
+            expires = datetime.fromisoformat(self.expires.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+        if expires.tzinfo is None:
+            expires = expires.replace(tzinfo=timezone.utc)
+        return expires.timestamp()
+
     @classmethod
     def from_api_dict(cls, data: Dict[str, Any]) -> 'Domain':
         """Create from GoDaddy API response"""
@@ -104,6 +199,16 @@ class Domain:
             locked=data.get('locked', False)
         )
 
+def _parse_rate_limit_headers(headers) -> Dict[str, Optional[int]]:
+    """Read the remaining request budget and any Retry-After delay from response headers"""
+    info = {}
+    for key, header in (('remaining', 'X-RateLimit-Remaining'), ('retry_after', 'Retry-After')):
+        try:
+            info[key] = int(headers[header])
+        except (KeyError, TypeError, ValueError):
+            info[key] = None
+    return info
+
 class RateLimiter:
     """Rate limiter for API requests"""
 
@@ -116,18 +221,20 @@ class RateLimiter:
     async def acquire(self):
         """Acquire rate limit token"""
         async with self._lock:
-            now = time.time()
+            while True:
+                now = time.time()
+
+                # Remove old requests outside the window
+                self.requests = [req_time for req_time in self.requests
+                               if now - req_time < self.window]
 
-            # Remove old requests outside the window
-            self.requests = [req_time for req_time in self.requests
-                           if now - req_time < self.window]
+                # Check if we can make a request
+                if len(self.requests) < self.max_requests:
+                    break
 
-            # Check if we can make a request
-            if len(self.requests) >= self.max_requests:
-                sleep_time = self.window - (now - self.requests[0])
-                if sleep_time > 0:
-                    await asyncio.sleep(sleep_time)
-                    return await self.acquire()
+                # Wait for the oldest request to leave the window; the lock is
+                # held (it is not reentrant), so concurrent callers queue in order
+                await asyncio.sleep(self.window - (now - self.requests[0]))
 
             # Record this request
             self.requests.append(now)
@@ -140,6 +247,8 @@ class GoDaddyAPIClient:
         self.profile = profile
         self.credentials = auth_manager.get_credentials(profile)
         self.rate_limiter = RateLimiter()
+        # Rate-limit headers of the most recent response
+        self.rate_limit_info: Dict[str, Optional[int]] = {}
         self._session: Optional[aiohttp.ClientSession] = None
 
         if not self.credentials:
@@ -174,6 +283,7 @@ class GoDaddyAPIClient:
             async with self._session.request(
                 method, url, params=params, json=json_data
             ) as response:
+                self.rate_limit_info = _parse_rate_limit_headers(response.headers)
                 response_data = await response.json()
 
                 if response.status >= 400:
@@ -218,6 +328,28 @@ class GoDaddyAPIClient:
         response = await self._request('GET', endpoint, params=params)
         return [DNSRecord.from_api_dict(record) for record in response]
 
+    async def aiter_dns_records(self, domain: str,
+                                record_type: Optional[str] = None,
+                                name: Optional[str] = None,
+                                page_size: int = 500) -> AsyncGenerator[DNSRecord, None]:
+        """Yield DNS records one page at a time using offset/limit pagination"""
+        endpoint = f'/domains/{domain}/records'
+        if record_type:
+            endpoint += f'/{record_type.upper()}'
+        if name:
+            endpoint += f'/{name}'
+
+        offset = 0
+        while True:
+            page = await self._request('GET', endpoint,
+                                       params={'offset': offset, 'limit': page_size})
+            for record in page:
+                yield DNSRecord.from_api_dict(record)
+
+            if len(page) < page_size:
+                break
+            offset += len(page)
+
     async def get_dns_record(self, domain: str, record_type: str, name: str) -> List[DNSRecord]:
         """Get specific DNS record"""
         response = await self._request('GET',
@@ -252,6 +384,19 @@ class GoDaddyAPIClient:
         except APIError:
             return False
 
+    async def delete_dns_records(self, domain: str, targets: List[Tuple[str, str]],
+                                 concurrency: int = 10) -> List[bool]:
+        """Delete several (record_type, name) record sets concurrently"""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def delete_one(record_type: str, name: str) -> bool:
+            async with semaphore:
+                return await self.delete_dns_record(domain, record_type, name)
+
+        return list(await asyncio.gather(
+            *[delete_one(record_type, name) for record_type, name in targets]
+        ))
+
     async def replace_all_records(self, domain: str, records: List[DNSRecord]) -> bool:
         """Replace all DNS records for domain"""
         try:
@@ -263,22 +408,36 @@ class GoDaddyAPIClient:
             return False
 
     async def bulk_update_records(self, domain: str, records: List[DNSRecord],
-                                 batch_size: int = 50) -> Dict[str, Any]:
-        """Bulk update DNS records with batching"""
+                                 batch_size: int = 50,
+                                 on_progress: Optional[Callable[[int], None]] = None,
+                                 concurrency: int = 1) -> Dict[str, Any]:
+        """Bulk update DNS records with batching
+
+        ``on_progress`` is called with the number of records in each batch as
+        soon as that batch completes, whether it succeeded or failed. Up to
+        ``concurrency`` batches are in flight at once.
+        """
         results = {'success': 0, 'failed': 0, 'errors': []}
+        semaphore = asyncio.Semaphore(concurrency)
 
-        # Process in batches
-        for i in range(0, len(records), batch_size):
+        async def send_batch(i: int):
             batch = records[i:i + batch_size]
 
-            try:
-                records_data = [record.to_api_dict() for record in batch]
-                await self._request('PATCH', f'/domains/{domain}/records',
-                                  json_data=records_data)
-                results['success'] += len(batch)
-            except APIError as e:
-                results['failed'] += len(batch)
-                results['errors'].append(f"Batch {i//batch_size + 1}: {str(e)}")
+            async with semaphore:
+                try:
+                    records_data = [record.to_api_dict() for record in batch]
+                    await self._request('PATCH', f'/domains/{domain}/records',
+                                      json_data=records_data)
+                    results['success'] += len(batch)
+                except APIError as e:
+                    results['failed'] += len(batch)
+                    results['errors'].append(f"Batch {i//batch_size + 1}: {str(e)}")
+
+            if on_progress:
+                on_progress(len(batch))
+
+        # Process in batches
+        await asyncio.gather(*[send_batch(i) for i in range(0, len(records), batch_size)])
 
         return results
 
@@ -341,59 +500,284 @@ class GoDaddyAPIClient:
 
         return results
 
-class APIError(Exception):
+class APIError(exceptions.APIError):
     """GoDaddy API error"""
 
     def __init__(self, message: str, status_code: int, response_data: Optional[Dict] = None):
-        super().__init__(message)
-        self.message = message
-        self.status_code = status_code
-        self.response_data = response_data or {}
+        super().__init__(message, status_code, response_data)
 
     def __str__(self):
         return f"API Error ({self.status_code}): {self.message}"
 
+def run_sync(coro):
+    """Run a coroutine to completion on the current thread's event loop
+
+    The loop is created once and then reused, so repeated calls neither
+    rebuild selectors nor leak loops, and keep-alive sessions stay bound to
+    the loop that opened them.
+    """
+    with warnings.catch_warnings():
+        # Python 3.12+ warns when get_event_loop() has to create the loop
+        warnings.simplefilter('ignore', DeprecationWarning)
+        try:
+            loop = asyncio.get_event_loop()
+        except RuntimeError:
+            loop = None
+
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    return loop.run_until_complete(coro)
+
 # Synchronous wrapper for backward compatibility
 class SyncGoDaddyAPIClient:
     """Synchronous wrapper for GoDaddyAPIClient"""
 
-    def __init__(self, auth_manager: AuthManager, profile: Optional[str] = None):
+    # Seconds a list_dns_records result (including an empty one) is reused
+    RECORDS_CACHE_TTL = 30
+
+    def __init__(self, auth_manager: AuthManager, profile: Optional[str] = None,
+                 use_cache: bool = False):
         self.auth_manager = auth_manager
         self.profile = profile
+        self.use_cache = use_cache
+        self._client: Optional[GoDaddyAPIClient] = None
+        self._keep_alive = False
+        self._records_cache: Dict[Tuple[str, Optional[str], Optional[str]],
+                                  Tuple[float, List[DNSRecord]]] = {}
+        self._api_cache: Optional[APICache] = None
+
+    def __enter__(self):
+        """Keep a single HTTP session open for every call until exit"""
+        self._keep_alive = True
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the shared HTTP session"""
+        self._keep_alive = False
+        self.close()
+
+    def close(self):
+        """Close the shared HTTP session, if one was opened, and flush the disk cache"""
+        if self._api_cache is not None:
+            self._api_cache.save()
+        if self._client is not None:
+            client, self._client = self._client, None
+            self._run_async(client.__aexit__(None, None, None))
 
     def _run_async(self, coro):
         """Run async coroutine in sync context"""
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        return loop.run_until_complete(coro)
+        return run_sync(coro)
 
     async def _execute_with_client(self, func, *args, **kwargs):
         """Execute function with async client"""
-        async with GoDaddyAPIClient(self.auth_manager, self.profile) as client:
-            return await func(client, *args, **kwargs)
+        if not self._keep_alive:
+            async with GoDaddyAPIClient(self.auth_manager, self.profile) as client:
+                return await func(client, *args, **kwargs)
+
+        if self._client is None:
+            self._client = await GoDaddyAPIClient(self.auth_manager, self.profile).__aenter__()
+        return await func(self._client, *args, **kwargs)
+
+    def _disk_cache(self) -> Optional[APICache]:
+        """On-disk response cache for this account, when caching is enabled"""
+        return self._account_cache() if self.use_cache else None
+
+    def _account_cache(self) -> Optional[APICache]:
+        """On-disk response cache for this account; writes invalidate it even when reads bypass it"""
+        if self._api_cache is None:
+            credentials = self.auth_manager.get_credentials(self.profile)
+            if not credentials:
+                return None
+            self._api_cache = APICache(
+                self.auth_manager.config.config_dir / 'cache',
+                f'{credentials.environment}:{credentials.api_key}'
+            )
+        return self._api_cache
+
+    def _cache_set(self, cache: APICache, key: str, value: Any, ttl: Optional[int] = None):
+        """Store a response; inside a with block the file is written once on exit"""
+        cache.set(key, value, ttl)
+        if not self._keep_alive:
+            cache.save()
 
     def list_domains(self) -> List[Domain]:
         """List all domains"""
-        return self._run_async(
+        cache = self._disk_cache()
+        if cache:
+            cached = cache.get('domains')
+            if cached is not None:
+                return [Domain(**data) for data in cached]
+
+        domains = self._run_async(
             self._execute_with_client(lambda client: client.list_domains())
         )
+        if cache:
+            self._cache_set(cache, 'domains', [asdict(domain) for domain in domains])
+        return domains
 
-    def list_dns_records(self, domain: str, record_type: Optional[str] = None) -> List[DNSRecord]:
-        """List DNS records"""
-        return self._run_async(
-            self._execute_with_client(
-                lambda client: client.list_dns_records(domain, record_type)
-            )
+    def get_domain(self, domain: str) -> Domain:
+        """Get domain details"""
+        cache = self._disk_cache()
+        key = f'domain:{domain}'
+        if cache:
+            cached = cache.get(key)
+            if cached is not None:
+                return Domain(**cached)
+
+        domain_info = self._run_async(
+            self._execute_with_client(lambda client: client.get_domain(domain))
         )
+        if cache:
+            self._cache_set(cache, key, asdict(domain_info))
+        return domain_info
+
+    def list_dns_records(self, domain: str, record_type: Optional[str] = None,
+                         name: Optional[str] = None) -> List[DNSRecord]:
+        """List DNS records, reusing a recent result for the same query"""
+        key = (domain, record_type.upper() if record_type else None, name)
+        cached = self._records_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.RECORDS_CACHE_TTL:
+            return list(cached[1])
+
+        cache = self._disk_cache()
+        disk_key = f'records:{domain}:{key[1] or ""}:{name or ""}'
+        disk_cached = cache.get(disk_key) if cache else None
+        if disk_cached is not None:
+            records = [DNSRecord(**data) for data in disk_cached]
+        else:
+            records = self._run_async(
+                self._execute_with_client(
+                    lambda client: client.list_dns_records(domain, record_type, name)
+                )
+            )
+            if cache:
+                # Never keep a listing longer than its shortest-lived record
+                self._cache_set(cache, disk_key, [asdict(record) for record in records],
+                                ttl=min((record.ttl for record in records), default=None))
+
+        self._records_cache[key] = (time.monotonic(), records)
+        return list(records)
+
+    def list_dns_records_for_domains(self, domains: Sequence[str], concurrency: int = 8
+                                     ) -> Dict[str, Union[List[DNSRecord], Exception]]:
+        """List the records of several domains over one session and rate limiter
+
+        At most concurrency requests are in flight at once. A domain whose
+        fetch failed maps to the exception instead of aborting the others.
+        """
+        cache = self._disk_cache()
+        results: Dict[str, Union[List[DNSRecord], Exception]] = {}
+        pending = []
+        for domain in domains:
+            cached = cache.get(f'records:{domain}::') if cache else None
+            if cached is not None:
+                results[domain] = [DNSRecord(**data) for data in cached]
+            else:
+                pending.append(domain)
+
+        async def fetch_all(client):
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch(domain: str) -> List[DNSRecord]:
+                async with semaphore:
+                    return await client.list_dns_records(domain)
+
+            return await asyncio.gather(*[fetch(domain) for domain in pending],
+                                        return_exceptions=True)
+
+        fetched = self._run_async(self._execute_with_client(fetch_all)) if pending else []
+        for domain, records in zip(pending, fetched):
+            results[domain] = records
+            if isinstance(records, Exception):
+                continue
+            self._records_cache[(domain, None, None)] = (time.monotonic(), records)
+            if cache:
+                cache.set(f'records:{domain}::', [asdict(record) for record in records],
+                          ttl=min((record.ttl for record in records), default=None))
+
+        if cache:
+            # One write for the whole batch
+            cache.save()
+        return {domain: results[domain] for domain in domains}
+
+    def consume_dns_records(self, domain: str, consumer: Callable[[DNSRecord], None],
+                            page_size: int = 500) -> int:
+        """Feed each DNS record to consumer as its page arrives; returns the count"""
+        async def drain(client):
+            count = 0
+            async for record in client.aiter_dns_records(domain, page_size=page_size):
+                consumer(record)
+                count += 1
+            return count
+
+        return self._run_async(self._execute_with_client(drain))
+
+    def invalidate_records(self, domain: str):
+        """Drop cached record listings for a domain, on disk too whether or not reads use it"""
+        for key in [key for key in self._records_cache if key[0] == domain]:
+            del self._records_cache[key]
+
+        cache = self._account_cache()
+        if cache:
+            cache.invalidate(f'records:{domain}:')
 
     def create_dns_record(self, domain: str, record: DNSRecord) -> bool:
         """Create DNS record"""
+        self.invalidate_records(domain)
         return self._run_async(
             self._execute_with_client(
                 lambda client: client.create_dns_record(domain, record)
             )
-        )
\ No newline at end of file
+        )
+
+    def update_dns_record(self, domain: str, record: DNSRecord) -> bool:
+        """Update DNS record"""
+        self.invalidate_records(domain)
+        return self._run_async(
+            self._execute_with_client(
+                lambda client: client.update_dns_record(domain, record)
+            )
+        )
+
+    def delete_dns_record(self, domain: str, record_type: str, name: str) -> bool:
+        """Delete DNS record"""
+        self.invalidate_records(domain)
+        return self._run_async(
+            self._execute_with_client(
+                lambda client: client.delete_dns_record(domain, record_type, name)
+            )
+        )
+
+    def replace_all_records(self, domain: str, records: List[DNSRecord]) -> bool:
+        """Replace all DNS records for domain"""
+        self.invalidate_records(domain)
+        return self._run_async(
+            self._execute_with_client(
+                lambda client: client.replace_all_records(domain, records)
+            )
+        )
+
+    def bulk_update_records(self, domain: str, records: List[DNSRecord], batch_size: int = 50,
+                            on_progress: Optional[Callable[[int], None]] = None,
+                            concurrency: int = 1) -> Dict[str, Any]:
+        """Bulk update DNS records, reporting progress per completed batch"""
+        self.invalidate_records(domain)
+        return self._run_async(
+            self._execute_with_client(
+                lambda client: client.bulk_update_records(domain, records, batch_size,
+                                                          on_progress=on_progress,
+                                                          concurrency=concurrency)
+            )
+        )
+
+    def delete_dns_records(self, domain: str, targets: List[Tuple[str, str]],
+                           concurrency: int = 10) -> List[bool]:
+        """Delete several (record_type, name) record sets over one session"""
+        self.invalidate_records(domain)
+        return self._run_async(
+            self._execute_with_client(
+                lambda client: client.delete_dns_records(domain, targets, concurrency)
+            )
+        )
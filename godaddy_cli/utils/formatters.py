@@ -5,9 +5,17 @@ Output formatting utilities for CLI responses
 import json
 import csv
 import yaml
-from typing import List, Dict, Any, Optional
+from dataclasses import asdict, is_dataclass
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, TextIO
 from io import StringIO
-from datetime import datetime
+from datetime import date, datetime, time
+from enum import Enum
+
+try:
+    import orjson
+except ImportError:  # optional C-accelerated encoder
+    orjson = None
 
 from rich.console import Console
 from rich.table import Table
@@ -20,6 +28,9 @@ from godaddy_cli.core.api_client import DNSRecord, Domain
 
 console = Console()
 
+# libyaml's C emitter when PyYAML was built with it
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 
 def format_dns_table(records: List[DNSRecord], title: str = "DNS Records") -> str:
     """
@@ -40,14 +51,14 @@ def format_dns_table(records: List[DNSRecord], title: str = "DNS Records") -> st
     table.add_column("TTL", style="yellow", justify="right")
     table.add_column("Priority", style="blue", justify="right")
 
-    for record in records:
-        priority = str(record.priority) if record.priority else "-"
+    fields = attrgetter('name', 'type', 'data', 'ttl', 'priority')
+    for name, record_type, data, ttl, priority in map(fields, records):
         table.add_row(
-            record.name,
-            record.type,
-            record.data,
-            str(record.ttl),
-            priority
+            name,
+            record_type,
+            data,
+            str(ttl),
+            str(priority) if priority else "-"
         )
 
     with StringIO() as output:
@@ -108,9 +119,53 @@ def format_json_output(data: Any, pretty: bool = True) -> str:
     Returns:
         JSON string
     """
+    if orjson is not None:
+        try:
+            option = orjson.OPT_INDENT_2 if pretty else 0
+            return orjson.dumps(data, option=option, default=_json_default).decode('utf-8')
+        except TypeError:
+            # Values orjson rejects (e.g. integers beyond 64 bits) fall back to stdlib json
+            pass
+
+    # Same text as orjson: raw UTF-8 and, when compact, no spaces after separators
     if pretty:
-        return json.dumps(data, indent=2, default=str)
-    return json.dumps(data, default=str)
+        return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=_json_default)
+
+
+def write_json_output(data: Any, stream: TextIO, pretty: bool = True) -> None:
+    """
+    Write data as JSON to an open text stream
+
+    Args:
+        data: Data to format
+        stream: Writable text stream
+        pretty: Whether to pretty-print
+    """
+    # json.dump encodes in chunks, so the full document never exists as one string
+    json.dump(data, stream, indent=2 if pretty else None,
+              separators=None if pretty else (',', ':'), ensure_ascii=False,
+              default=_json_default)
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Serialize values the json module doesn't handle, the same way orjson does
+
+    Args:
+        obj: Value json.dumps could not encode
+
+    Returns:
+        A JSON-encodable stand-in: ISO 8601 for dates and times, the value
+        of an Enum, a dict for a dataclass and the string form otherwise
+    """
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return str(obj)
 
 
 def format_yaml_output(data: Any) -> str:
@@ -123,7 +178,18 @@ def format_yaml_output(data: Any) -> str:
     Returns:
         YAML string
     """
-    return yaml.dump(data, default_flow_style=False, sort_keys=False)
+    return yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
+
+
+def write_yaml_output(data: Any, stream: TextIO) -> None:
+    """
+    Write data as YAML to an open text stream
+
+    Args:
+        data: Data to format
+        stream: Writable text stream
+    """
+    yaml.dump(data, stream, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
 
 
 def format_csv_output(records: List[DNSRecord]) -> str:
@@ -137,7 +203,19 @@ def format_csv_output(records: List[DNSRecord]) -> str:
         CSV string
     """
     output = StringIO()
-    writer = csv.writer(output)
+    write_csv_output(records, output)
+    return output.getvalue()
+
+
+def write_csv_output(records: Iterable[DNSRecord], stream: TextIO) -> None:
+    """
+    Write DNS records as CSV to an open text stream
+
+    Args:
+        records: DNS records to write
+        stream: Writable text stream
+    """
+    writer = csv.writer(stream)
 
     # Write header
     writer.writerow(['name', 'type', 'data', 'ttl', 'priority', 'weight', 'port'])
@@ -154,8 +232,6 @@ def format_csv_output(records: List[DNSRecord]) -> str:
             record.port or ''
         ])
 
-    return output.getvalue()
-
 
 def format_status_panel(status: str, message: str) -> str:
     """
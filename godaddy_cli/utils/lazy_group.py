@@ -0,0 +1,65 @@
+"""
+Click group that imports its subcommands on demand
+"""
+
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Group whose subcommands are resolved from ``(module, attr, short_help)`` entries on first use
+
+    The short help lets ``--help`` list a subcommand without importing it.
+    """
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, Tuple[str, str, str]]] = None,
+                 **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List subcommands, rendering ones not yet imported from their stored short help"""
+        commands = []
+        for cmd_name in self.list_commands(ctx):
+            if cmd_name in self.lazy_subcommands:
+                # A bare placeholder renders the stored help exactly as click would
+                short_help = self.lazy_subcommands[cmd_name][2]
+                commands.append((cmd_name, click.Command(cmd_name, short_help=short_help)))
+                continue
+
+            command = self.get_command(ctx, cmd_name)
+            if command is None or command.hidden:
+                continue
+            commands.append((cmd_name, command))
+
+        if not commands:
+            return
+
+        # Same layout as click.Group: allow for 3 times the default spacing
+        limit = formatter.width - 6 - max(len(cmd_name) for cmd_name, _ in commands)
+        rows = [(cmd_name, command.get_short_help_str(limit)) for cmd_name, command in commands]
+        with formatter.section('Commands'):
+            formatter.write_dl(rows)
+
+    def _load_command(self, cmd_name: str) -> Optional[click.Command]:
+        """Import the command on first lookup and register it like an eager one"""
+        module_name, attr, _ = self.lazy_subcommands.pop(cmd_name)
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            # Same outcome as the eager try/except registration: the command is unavailable
+            return None
+
+        command = getattr(module, attr)
+        self.add_command(command, cmd_name)
+        return command
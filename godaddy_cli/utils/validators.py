@@ -2,14 +2,27 @@
 Validation utilities for DNS records and configuration
 """
 
-import re
+import functools
 import ipaddress
+import re
 from typing import List, Optional
 from urllib.parse import urlparse
 
 from godaddy_cli.core.exceptions import ValidationError
 
 
+# Patterns are compiled once at import rather than on every validation call
+_DOMAIN_PATTERN = re.compile(
+    r'^[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$'
+)
+_SUBDOMAIN_PATTERN = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9-_]{0,61}[a-zA-Z0-9])?$')
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+_IP_CLASSES = {4: ipaddress.IPv4Address, 6: ipaddress.IPv6Address}
+
+
+# Pure function of its input; hostnames repeat a lot across nameservers and record targets
+@functools.lru_cache(maxsize=4096)
 def validate_domain(domain: str) -> bool:
     """
     Validate domain name format
@@ -33,8 +46,7 @@ def validate_domain(domain: str) -> bool:
         domain = domain[:-1]
 
     # Check for valid characters and structure
-    pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)*$'
-    if not re.match(pattern, domain):
+    if not _DOMAIN_PATTERN.match(domain):
         raise ValidationError(f"Invalid domain format: {domain}")
 
     # Check each label
@@ -76,8 +88,7 @@ def validate_subdomain(subdomain: str) -> bool:
         raise ValidationError("Subdomain too long (max 63 characters)")
 
     # Check for valid characters
-    pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9-_]{0,61}[a-zA-Z0-9])?$'
-    if not re.match(pattern, subdomain):
+    if not _SUBDOMAIN_PATTERN.match(subdomain):
         raise ValidationError(f"Invalid subdomain format: {subdomain}")
 
     if subdomain.startswith('-') or subdomain.endswith('-'):
@@ -103,6 +114,15 @@ def validate_ip(ip: str, version: Optional[int] = None) -> bool:
     if not ip:
         raise ValidationError("IP address cannot be empty")
 
+    # Parse straight into the requested family instead of probing both
+    ip_class = _IP_CLASSES.get(version)
+    if ip_class is not None:
+        try:
+            ip_class(ip)
+            return True
+        except ValueError:
+            pass
+
     try:
         addr = ipaddress.ip_address(ip)
 
@@ -127,6 +147,10 @@ def validate_ttl(ttl: int) -> bool:
     Raises:
         ValidationError: If TTL is invalid
     """
+    # Common case: a valid integer TTL needs a single range comparison
+    if isinstance(ttl, int) and 300 <= ttl <= 86400:
+        return True
+
     if not isinstance(ttl, int):
         raise ValidationError("TTL must be an integer")
 
@@ -358,8 +382,7 @@ def validate_email(email: str) -> bool:
     if not email:
         raise ValidationError("Email cannot be empty")
 
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(pattern, email):
+    if not _EMAIL_PATTERN.match(email):
         raise ValidationError(f"Invalid email format: {email}")
 
     return True
@@ -60,6 +60,12 @@ dev_requires = [
     'twine>=4.0.0',
 ]
 
+# Optional native serialization speedups
+fast_requires = [
+    'orjson>=3.8.0',
+    'fastjsonschema>=2.16.0',
+]
+
 # Web UI dependencies
 web_requires = [
     'fastapi>=0.100.0',
@@ -98,7 +104,8 @@ setup(
     extras_require={
         'dev': dev_requires,
         'web': web_requires,
-        'all': install_requires + dev_requires + web_requires,
+        'fast': fast_requires,
+        'all': install_requires + dev_requires + web_requires + fast_requires,
     },
     entry_points={
         'console_scripts': [
@@ -0,0 +1,67 @@
+"""
+Unit tests for the on-disk API response cache
+"""
+
+import pytest
+from unittest.mock import patch
+
+from godaddy_cli.core.api_cache import APICache, MAX_TTL
+
+
+@pytest.mark.unit
+class TestAPICache:
+    """Test APICache"""
+
+    def test_round_trip_persists_across_instances(self, tmp_path):
+        """Test a stored value is visible to a fresh cache for the same account"""
+        cache = APICache(tmp_path, 'production:key')
+        cache.set('domains', [{'domain': 'example.com'}])
+        cache.save()
+
+        assert APICache(tmp_path, 'production:key').get('domains') == [{'domain': 'example.com'}]
+        assert APICache(tmp_path, 'ote:key').get('domains') is None
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        """Test entries are not returned past their TTL, which is capped"""
+        cache = APICache(tmp_path, 'production:key')
+
+        with patch('godaddy_cli.core.api_cache.time.time', return_value=1000.0):
+            cache.set('records:example.com::', [], ttl=MAX_TTL * 10)
+
+        with patch('godaddy_cli.core.api_cache.time.time', return_value=1000.0 + MAX_TTL - 1):
+            assert cache.get('records:example.com::') == []
+        with patch('godaddy_cli.core.api_cache.time.time', return_value=1000.0 + MAX_TTL):
+            assert cache.get('records:example.com::') is None
+
+    def test_invalidate_by_prefix(self, tmp_path):
+        """Test invalidation only drops matching keys"""
+        cache = APICache(tmp_path, 'production:key')
+        cache.set('records:example.com:A:', [])
+        cache.set('domain:example.com', {'domain': 'example.com'})
+
+        cache.invalidate('records:example.com:')
+
+        assert cache.get('records:example.com:A:') is None
+        assert cache.get('domain:example.com') == {'domain': 'example.com'}
+
+    def test_set_is_written_on_save(self, tmp_path):
+        """Test stores are batched in memory until save, which writes the file once"""
+        cache = APICache(tmp_path, 'production:key')
+        cache.set('records:a.example::', [])
+        cache.set('records:b.example::', [])
+
+        assert not cache.path.exists()
+
+        cache.save()
+
+        assert APICache(tmp_path, 'production:key').get('records:b.example::') == []
+
+    def test_invalidate_persists_immediately(self, tmp_path):
+        """Test invalidation reaches other instances without an explicit save"""
+        cache = APICache(tmp_path, 'production:key')
+        cache.set('records:example.com:A:', [])
+        cache.save()
+
+        APICache(tmp_path, 'production:key').invalidate('records:example.com:')
+
+        assert APICache(tmp_path, 'production:key').get('records:example.com:A:') is None
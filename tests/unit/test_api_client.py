@@ -4,7 +4,7 @@ Unit tests for API client
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, AsyncMock, call, patch
 import aiohttp
 
 from godaddy_cli.core.api_client import (
@@ -17,6 +17,13 @@ from godaddy_cli.core.api_client import (
     RecordType
 )
 from godaddy_cli.core.auth import AuthManager, APICredentials
+from godaddy_cli.core.exceptions import ValidationError
+
+
+@pytest.fixture
+def spec_auth():
+    """AuthManager stand-in whose get_credentials can be stubbed"""
+    return Mock(spec=AuthManager)
 
 
 @pytest.mark.unit
@@ -109,6 +116,28 @@ class TestDNSRecord:
         assert record.ttl == 3600
         assert record.priority == 10
 
+    def test_dns_record_from_csv_row(self):
+        """Test creating DNS record from a CSV row of strings"""
+        columns = {'name': 0, 'type': 1, 'data': 2, 'ttl': 3, 'priority': 4, 'weight': 5}
+        row = ['@', 'MX', 'mail.example.com', '', '10']
+
+        record = DNSRecord.from_csv_row(row, columns)
+
+        assert record.ttl == 3600
+        assert record.priority == 10
+        assert record.weight is None
+        assert record.port is None
+
+    def test_dns_record_validate(self):
+        """Test record validation by type"""
+        assert DNSRecord(name='www', type='A', data='192.168.1.1').validate()
+        assert DNSRecord(name='@', type='MX', data='mail.example.com', priority=10).validate()
+
+        with pytest.raises(ValidationError):
+            DNSRecord(name='www', type='A', data='not-an-ip').validate()
+        with pytest.raises(ValidationError):
+            DNSRecord(name='@', type='MX', data='mail.example.com').validate()
+
 
 @pytest.mark.unit
 class TestDomain:
@@ -136,6 +165,13 @@ class TestDomain:
         assert domain.privacy is True
         assert domain.locked is False
 
+    def test_domain_expires_ts(self):
+        """Test expiry is parsed to a UTC timestamp, or None when unusable"""
+        assert Domain(domain='example.com', status='ACTIVE',
+                      expires='2030-01-01T00:00:00.000Z').expires_ts == 1893456000.0
+        assert Domain(domain='example.com', status='ACTIVE', expires='soon').expires_ts is None
+        assert Domain(domain='example.com', status='ACTIVE').expires_ts is None
+
 
 @pytest.mark.unit
 class TestRateLimiter:
@@ -197,6 +233,15 @@ class TestAPIError:
 
         assert error.response_data == {}
 
+    def test_api_error_is_core_api_error(self):
+        """Test client errors are caught by handlers for the core APIError"""
+        from godaddy_cli.core import exceptions
+
+        error = APIError("Too many requests", 429)
+
+        assert isinstance(error, exceptions.APIError)
+        assert error.message == "Too many requests"
+
 
 @pytest.mark.unit
 class TestGoDaddyAPIClient:
@@ -403,6 +448,54 @@ class TestGoDaddyAPIClient:
             '/domains/example.com/records/A/www'
         )
 
+    @pytest.mark.asyncio
+    async def test_delete_dns_records(self, spec_auth):
+        """Test deleting several record sets concurrently"""
+        spec_auth.get_credentials.return_value = APICredentials(
+            api_key='key123',
+            api_secret='secret456'
+        )
+
+        client = GoDaddyAPIClient(spec_auth)
+        client._request = AsyncMock(side_effect=[{}, APIError('Not found', 404)])
+
+        results = await client.delete_dns_records(
+            'example.com', [('a', 'www'), ('CNAME', 'blog')], concurrency=2
+        )
+
+        assert results == [True, False]
+        assert client._request.call_args_list == [
+            call('DELETE', '/domains/example.com/records/A/www'),
+            call('DELETE', '/domains/example.com/records/CNAME/blog'),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_aiter_dns_records_paginates(self, spec_auth):
+        """Test streaming records page by page until a short page"""
+        spec_auth.get_credentials.return_value = APICredentials(
+            api_key='key123',
+            api_secret='secret456'
+        )
+
+        client = GoDaddyAPIClient(spec_auth)
+        client._request = AsyncMock(side_effect=[
+            [{'name': 'www', 'type': 'A', 'data': '192.168.1.1', 'ttl': 3600},
+             {'name': 'mail', 'type': 'A', 'data': '192.168.1.2', 'ttl': 3600}],
+            [{'name': 'ftp', 'type': 'A', 'data': '192.168.1.3', 'ttl': 3600},
+             {'name': 'api', 'type': 'A', 'data': '192.168.1.4', 'ttl': 3600}],
+            [{'name': '@', 'type': 'A', 'data': '192.168.1.5', 'ttl': 3600}],
+            AssertionError('requested a page after the short one'),
+        ])
+
+        names = [r.name async for r in client.aiter_dns_records('example.com', page_size=2)]
+
+        assert names == ['www', 'mail', 'ftp', 'api', '@']
+        assert client._request.call_args_list == [
+            call('GET', '/domains/example.com/records', params={'offset': 0, 'limit': 2}),
+            call('GET', '/domains/example.com/records', params={'offset': 2, 'limit': 2}),
+            call('GET', '/domains/example.com/records', params={'offset': 4, 'limit': 2}),
+        ]
+
     @pytest.mark.asyncio
     async def test_bulk_update_records(self, mock_auth, sample_dns_records):
         """Test bulk updating records"""
@@ -420,6 +513,25 @@ class TestGoDaddyAPIClient:
         assert result['failed'] == 0
         assert len(result['errors']) == 0
 
+    @pytest.mark.asyncio
+    async def test_bulk_update_records_reports_progress(self, spec_auth, sample_dns_records):
+        """Test bulk update invokes the progress callback once per batch"""
+        spec_auth.get_credentials.return_value = APICredentials(
+            api_key='key123',
+            api_secret='secret456'
+        )
+
+        client = GoDaddyAPIClient(spec_auth)
+        client._request = AsyncMock(return_value={})
+        progress = Mock()
+
+        await client.bulk_update_records('example.com', sample_dns_records, batch_size=2,
+                                         on_progress=progress)
+
+        reported = sum(call.args[0] for call in progress.call_args_list)
+        assert reported == len(sample_dns_records)
+        assert progress.call_count == (len(sample_dns_records) + 1) // 2
+
     @pytest.mark.asyncio
     async def test_convenience_methods(self, mock_auth):
         """Test convenience methods for common record types"""
@@ -526,4 +638,74 @@ class TestSyncGoDaddyAPIClient:
 
         success = client.create_dns_record('example.com', record)
 
-        assert success is True
\ No newline at end of file
+        assert success is True
+
+    def test_keep_alive_reuses_client_session(self, mock_auth, sample_domains):
+        """Test the context manager keeps one async client across calls"""
+        async_client = Mock()
+        async_client.__aenter__ = AsyncMock(return_value=async_client)
+        async_client.__aexit__ = AsyncMock(return_value=None)
+        async_client.list_domains = AsyncMock(return_value=sample_domains)
+
+        with patch('godaddy_cli.core.api_client.GoDaddyAPIClient', return_value=async_client) as mock_cls:
+            with SyncGoDaddyAPIClient(mock_auth) as client:
+                first = client.list_domains()
+                second = client.list_domains()
+
+                async_client.__aexit__.assert_not_awaited()
+
+        assert first == second == sample_domains
+        mock_cls.assert_called_once()
+        async_client.__aexit__.assert_awaited_once()
+
+    @patch.object(SyncGoDaddyAPIClient, '_run_async')
+    def test_sync_list_dns_records_cached(self, mock_run_async, mock_auth, sample_dns_records):
+        """Test record listings are reused until a mutation invalidates them"""
+        mock_run_async.return_value = sample_dns_records
+
+        client = SyncGoDaddyAPIClient(mock_auth)
+        client.list_dns_records('example.com', 'a')
+        records = client.list_dns_records('example.com', 'A')
+
+        assert records == sample_dns_records
+        assert mock_run_async.call_count == 1
+
+        client.delete_dns_record('example.com', 'A', 'www')
+        client.list_dns_records('example.com', 'A')
+
+        assert mock_run_async.call_count == 3
+
+    @patch.object(SyncGoDaddyAPIClient, '_run_async')
+    def test_writes_invalidate_disk_cache(self, mock_run_async, tmp_path, sample_dns_records):
+        """Test a client that bypasses the disk cache still drops its stale listings"""
+        auth = Mock(spec=AuthManager)
+        auth.config = Mock(config_dir=tmp_path)
+        auth.get_credentials.return_value = APICredentials(
+            api_key='key123',
+            api_secret='secret456'
+        )
+        mock_run_async.return_value = sample_dns_records
+        SyncGoDaddyAPIClient(auth, use_cache=True).list_dns_records('example.com')
+
+        assert SyncGoDaddyAPIClient(auth, use_cache=True)._disk_cache().get('records:example.com::')
+
+        mock_run_async.return_value = True
+        SyncGoDaddyAPIClient(auth).create_dns_record('example.com', sample_dns_records[0])
+
+        assert SyncGoDaddyAPIClient(auth, use_cache=True)._disk_cache().get('records:example.com::') is None
+
+    def test_list_dns_records_for_domains_shares_one_client(self, mock_auth, sample_dns_records):
+        """Test several domains are fetched over one async client, keeping failures per domain"""
+        async_client = Mock()
+        async_client.__aenter__ = AsyncMock(return_value=async_client)
+        async_client.__aexit__ = AsyncMock(return_value=None)
+        error = APIError('Not found', 404)
+        async_client.list_dns_records = AsyncMock(side_effect=[sample_dns_records, error])
+
+        client = SyncGoDaddyAPIClient(mock_auth)
+        with patch('godaddy_cli.core.api_client.GoDaddyAPIClient', return_value=async_client) as mock_cls:
+            results = client.list_dns_records_for_domains(['example.com', 'example.org'],
+                                                          concurrency=2)
+
+        mock_cls.assert_called_once()
+        assert results == {'example.com': sample_dns_records, 'example.org': error}
@@ -0,0 +1,37 @@
+"""
+Unit tests for the top-level CLI group
+"""
+
+import importlib
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from godaddy_cli.cli import cli, LAZY_SUBCOMMANDS
+
+
+@pytest.mark.unit
+class TestLazySubcommands:
+    """Test the lazily imported subcommands"""
+
+    def test_help_does_not_import_lazy_commands(self, monkeypatch):
+        """Test --help lists lazy commands from their stored short help"""
+        monkeypatch.setattr(cli, 'lazy_subcommands', dict(LAZY_SUBCOMMANDS))
+        for module_name, _, _ in LAZY_SUBCOMMANDS.values():
+            monkeypatch.delitem(sys.modules, module_name, raising=False)
+
+        result = CliRunner().invoke(cli, ['--help'])
+
+        assert result.exit_code == 0
+        for cmd_name, (module_name, _, short_help) in LAZY_SUBCOMMANDS.items():
+            assert module_name not in sys.modules
+            assert cmd_name in result.output
+            assert short_help in result.output
+
+    def test_stored_short_help_matches_command(self):
+        """Test the stored short help is what the imported command reports"""
+        for module_name, attr, short_help in LAZY_SUBCOMMANDS.values():
+            command = getattr(importlib.import_module(module_name), attr)
+
+            assert command.get_short_help_str() == short_help
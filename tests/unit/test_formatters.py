@@ -0,0 +1,56 @@
+"""
+Unit tests for output formatters
+"""
+
+import enum
+import io
+from datetime import date, datetime
+
+import pytest
+from unittest.mock import patch
+
+from godaddy_cli.core.api_client import DNSRecord
+from godaddy_cli.utils import formatters
+
+
+class Color(enum.Enum):
+    RED = 'red'
+    GREEN = 2
+
+
+PAYLOAD = {
+    'created': datetime(2024, 1, 2, 3, 4, 5),
+    'expires': date(2025, 6, 7),
+    'colors': [Color.RED, Color.GREEN],
+    'note': 'café ✓',
+    'record': DNSRecord(name='www', type='A', data='192.168.1.1', ttl=3600),
+}
+
+
+@pytest.mark.unit
+class TestJSONOutput:
+    """Test JSON output is the same with and without orjson"""
+
+    @pytest.mark.parametrize('pretty', [True, False])
+    def test_orjson_and_stdlib_agree(self, pretty):
+        """Test both encoders produce identical text for the same payload"""
+        pytest.importorskip('orjson')
+
+        fast = formatters.format_json_output(PAYLOAD, pretty=pretty)
+        with patch.object(formatters, 'orjson', None):
+            fallback = formatters.format_json_output(PAYLOAD, pretty=pretty)
+
+        assert fallback == fast
+        assert '"2024-01-02T03:04:05"' in fallback
+        assert '"2025-06-07"' in fallback
+        assert '"red"' in fallback
+        assert 'café ✓' in fallback
+
+    @pytest.mark.parametrize('pretty', [True, False])
+    def test_stream_writer_matches_formatter(self, pretty):
+        """Test write_json_output emits the same text as format_json_output"""
+        stream = io.StringIO()
+        formatters.write_json_output(PAYLOAD, stream, pretty=pretty)
+
+        with patch.object(formatters, 'orjson', None):
+            assert stream.getvalue() == formatters.format_json_output(PAYLOAD, pretty=pretty)